@@ -511,7 +511,7 @@ def machine_learning_expert(
         
         Args:
             modality_name: Name of the modality to export
-            format: Export format ("numpy", "csv", "pytorch", "tensorflow")
+            format: Export format ("numpy", "parquet", "csv", "pytorch", "tensorflow")
             include_labels: Whether to export labels/targets
             label_column: Column name containing labels
             output_dir: Directory for exported files
@@ -589,7 +589,7 @@ def machine_learning_expert(
                 np.save(export_path / f"{modality_name}_sample_names.npy", adata.obs_names.values)
                 exported_files.append(f"{modality_name}_sample_names.npy")
                 
-            elif format == "csv":
+            elif format in ("csv", "parquet"):
                 # Create DataFrame with features
                 feature_df = pd.DataFrame(X, 
                                         index=adata.obs_names, 
@@ -599,10 +599,16 @@ def machine_learning_expert(
                 if y is not None:
                     feature_df['_label'] = y
                 
-                # Save to CSV
-                csv_path = export_path / f"{modality_name}_ml_data.csv"
-                feature_df.to_csv(csv_path)
-                exported_files.append(f"{modality_name}_ml_data.csv")
+                if format == "csv":
+                    # Save to CSV
+                    csv_path = export_path / f"{modality_name}_ml_data.csv"
+                    feature_df.to_csv(csv_path)
+                    exported_files.append(f"{modality_name}_ml_data.csv")
+                else:
+                    # Same table stored as binary columns instead of formatted text
+                    parquet_path = export_path / f"{modality_name}_ml_data.parquet"
+                    feature_df.to_parquet(parquet_path, compression="snappy")
+                    exported_files.append(f"{modality_name}_ml_data.parquet")
                 
             elif format == "pytorch":
                 # Create PyTorch tensors
@@ -1451,6 +1457,7 @@ train_scvi_embedding("single_cell_data",
 - pytorch: For deep learning with PyTorch (.pt tensors)
 - tensorflow: For deep learning with TensorFlow/Keras (.npz format)
 - numpy: For scikit-learn and general ML (.npy arrays)
+- parquet: For pandas/Arrow-based pipelines on large matrices (compact binary table)
 - csv: For broad compatibility and manual inspection
 
 <Critical Operating Principles>
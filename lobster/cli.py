@@ -22,6 +22,7 @@ from rich import box
 from rich import console
 
 from lobster.core.client import AgentClient
+from lobster.core.data_manager_v2 import sanitize_plot_title
 # Import new UI system
 from lobster.ui import LobsterTheme
 from lobster.ui.console_manager import get_console_manager
@@ -3042,10 +3043,7 @@ when they are started by agents or analysis workflows.
                 plot_title = plot_info["title"]
                 
                 # Create sanitized filename (same logic as save_plots_to_workspace)
-                safe_title = "".join(
-                    c for c in plot_title if c.isalnum() or c in [" ", "_", "-"]
-                ).rstrip()
-                safe_title = safe_title.replace(" ", "_")
+                safe_title = sanitize_plot_title(plot_title)
                 filename_base = f"{plot_id}_{safe_title}" if safe_title else plot_id
                 
                 # Try to open HTML file first, then PNG
@@ -3299,14 +3297,23 @@ def serve(
     Start the agent system as an API server (for React UI).
     """
     from fastapi import FastAPI, HTTPException
+    from fastapi.responses import JSONResponse
     from pydantic import BaseModel
     import uvicorn
     
+    # Serialize responses with orjson when it is installed
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse as DefaultResponse
+    except ImportError:
+        DefaultResponse = JSONResponse
+    
     # Create FastAPI app
     api = FastAPI(
         title="Lobster Agent API",
         description="🦞 Multi-Agent Bioinformatics System by Omics-OS",
-        version="2.0"
+        version="2.0",
+        default_response_class=DefaultResponse
     )
     
     class QueryRequest(BaseModel):
@@ -3328,8 +3335,20 @@ def serve(
         client = init_client()
         return client.get_status()
     
-    console.print(f"[red]🦞 Starting Lobster API server on {host}:{port}[/red]")
-    uvicorn.run(api, host=host, port=port)
+    # Prefer the uvloop event loop and httptools parser when installed
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
+    console.print(f"[red]🦞 Starting Lobster API server on {host}:{port} ({loop}, {http})[/red]")
+    uvicorn.run(api, host=host, port=port, loop=loop, http=http)
 
 
 # Config subcommands
@@ -5,15 +5,21 @@ This module provides a flexible, type-safe configuration system that allows
 per-agent model configuration for easy testing and deployment.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Optional, Any
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Any
 from enum import Enum
 import os
-import json
-from dotenv import load_dotenv
+import sys
+import threading
+from pathlib import Path
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class ModelProvider(Enum):
     """Supported model providers."""
@@ -29,7 +35,53 @@ class ModelTier(Enum):
     HEAVY = "heavy"
     ULTRA = "ultra"
 
-@dataclass
+_dotenv_loaded = False
+
+def _ensure_dotenv_loaded():
+    """
+    Load environment variables from .env once per process.
+
+    Deferred until a configurator is created so importers that only need
+    the config types skip the dotenv import. Containers that inject the
+    environment directly can opt out with LOBSTER_SKIP_DOTENV=1.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded or os.environ.get('LOBSTER_SKIP_DOTENV') == '1':
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _dotenv_loaded = True
+
+@lru_cache(maxsize=None)
+def _provider_extras() -> Dict[ModelProvider, Dict[str, Any]]:
+    """
+    Provider-specific LLM parameters merged into every agent's base parameters.
+
+    Credentials are snapshotted on first use, after .env has been loaded,
+    and re-read after cache_clear() (see _invalidate_llm_cache).
+    """
+    aws_creds = {
+        "aws_access_key_id": os.environ.get('AWS_BEDROCK_ACCESS_KEY'),
+        "aws_secret_access_key": os.environ.get('AWS_BEDROCK_SECRET_ACCESS_KEY'),
+    }
+    openai_creds = {
+        "openai_api_key": os.environ.get('OPENAI_API_KEY'),
+    }
+    return {
+        ModelProvider.BEDROCK_ANTHROPIC: aws_creds,
+        ModelProvider.BEDROCK_META: aws_creds,
+        ModelProvider.BEDROCK_AMAZON: aws_creds,
+        ModelProvider.OPENAI: openai_creds,
+    }
+
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    import json
+    return json.dumps(data, indent=2).encode()
+
+@dataclass(slots=True, frozen=True)
 class ThinkingConfig:
     """Configuration for model thinking/reasoning feature."""
     enabled: bool = False
@@ -47,7 +99,7 @@ class ThinkingConfig:
             }
         }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     """Configuration for a specific model."""
     provider: ModelProvider
@@ -57,14 +109,8 @@ class ModelConfig:
     region: str = "us-east-2"
     description: str = ""
     supports_thinking: bool = False  # Flag for models that support thinking
-    
-    def __post_init__(self):
-        if isinstance(self.provider, str):
-            self.provider = ModelProvider(self.provider)
-        if isinstance(self.tier, str):
-            self.tier = ModelTier(self.tier)
 
-@dataclass
+@dataclass(slots=True)
 class AgentModelConfig:
     """Model configuration for a specific agent."""
     name: str
@@ -74,6 +120,92 @@ class AgentModelConfig:
     custom_params: Dict = field(default_factory=dict)
     thinking_config: Optional[ThinkingConfig] = None
 
+# US region model configurations
+_US_MODEL_PRESETS = {
+    # Anthropic Claude Models - Lightweight (Haiku family)
+    "claude-3-haiku": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-3-haiku-20240307-v1:0",
+        tier=ModelTier.LIGHTWEIGHT,
+        temperature=1.0,
+        description="Fast, cost-effective Claude 3 Haiku for simple tasks",
+        supports_thinking=False
+    ),
+    
+    "claude-3-5-haiku": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+        tier=ModelTier.LIGHTWEIGHT,
+        temperature=1.0,
+        description="Fast, cost-effective Claude 3.5 Haiku for simple tasks",
+        supports_thinking=False
+    ),
+    
+    "claude-3-5-sonnet-v2": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        tier=ModelTier.STANDARD,
+        temperature=1.0,
+        description="Latest Claude 3.5 Sonnet v2 with enhanced capabilities",
+        supports_thinking=False
+    ),
+    
+    "claude-4-sonnet": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+        tier=ModelTier.STANDARD,
+        temperature=1.0,
+        description="Next-generation Claude 4 Sonnet model",
+        supports_thinking=True
+    ),
+    
+    "claude-4-opus": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-opus-4-20250514-v1:0",
+        tier=ModelTier.HEAVY,
+        temperature=1.0,
+        description="Advanced Claude 4 Opus for complex reasoning",
+        supports_thinking=True
+    ),
+    
+    "claude-4-1-opus": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-opus-4-1-20250805-v1:0",
+        tier=ModelTier.HEAVY,
+        temperature=1.0,
+        description="Latest Claude 4.1 Opus with cutting-edge capabilities",
+        supports_thinking=True
+    ),
+    
+    # Ultra Performance Models
+    "claude-3-7-sonnet": ModelConfig(
+        provider=ModelProvider.BEDROCK_ANTHROPIC,
+        model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+        tier=ModelTier.ULTRA,
+        temperature=1.0,
+        description="Highest-performance Claude 3.7 Sonnet model with thinking support",
+        supports_thinking=True
+    )
+}
+
+# US presets mirrored into eu-central-1 for EU compliance, with their descriptions
+_EU_MIRROR_DESCRIPTIONS = {
+    "claude-3-5-haiku": "EU region Claude 3.5 Haiku model",
+    "claude-3-5-sonnet-v2": "EU region Claude 3.5 Sonnet v2 model",
+    "claude-4-opus": "EU region Claude 4 Opus model",
+    "claude-4-1-opus": "EU region Claude 4.1 Opus model",
+    "claude-3-7-sonnet": "EU region Claude 3.7 Sonnet model with thinking support",
+}
+
+def _eu_mirror(name: str, config: ModelConfig, description: str) -> Tuple[str, ModelConfig]:
+    """Derive the EU region preset for a US preset."""
+    return f"{name}-eu", replace(
+        config,
+        model_id=config.model_id.replace("us.", "eu.", 1),
+        region="eu-central-1",
+        description=description
+    )
+
 class LobsterAgentConfigurator:
     """
     Professional configuration manager for Lobster AI agents.
@@ -86,128 +218,20 @@ class LobsterAgentConfigurator:
     - Production-ready validation
     - Thinking/reasoning support for compatible models
     """
+
+    __slots__ = ('profile', '_agent_configs', '_llm_params_cache')
     
-    # Pre-defined model configurations
-    MODEL_PRESETS = {
-        # Anthropic Claude Models - Lightweight (Haiku family)
-        "claude-3-haiku": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-3-haiku-20240307-v1:0",
-            tier=ModelTier.LIGHTWEIGHT,
-            temperature=1.0,
-            description="Fast, cost-effective Claude 3 Haiku for simple tasks",
-            supports_thinking=False
-        ),
-        
-        "claude-3-5-haiku": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0",
-            tier=ModelTier.LIGHTWEIGHT,
-            temperature=1.0,
-            description="Fast, cost-effective Claude 3.5 Haiku for simple tasks",
-            supports_thinking=False
-        ),
-        
-        "claude-3-5-sonnet-v2": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            tier=ModelTier.STANDARD,
-            temperature=1.0,
-            description="Latest Claude 3.5 Sonnet v2 with enhanced capabilities",
-            supports_thinking=False
-        ),
-        
-        "claude-4-sonnet": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-            tier=ModelTier.STANDARD,
-            temperature=1.0,
-            description="Next-generation Claude 4 Sonnet model",
-            supports_thinking=True
-        ),
-        
-        "claude-4-opus": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-opus-4-20250514-v1:0",
-            tier=ModelTier.HEAVY,
-            temperature=1.0,
-            description="Advanced Claude 4 Opus for complex reasoning",
-            supports_thinking=True
-        ),
-        
-        "claude-4-1-opus": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-opus-4-1-20250805-v1:0",
-            tier=ModelTier.HEAVY,
-            temperature=1.0,
-            description="Latest Claude 4.1 Opus with cutting-edge capabilities",
-            supports_thinking=True
-        ),
-        
-        # Ultra Performance Models
-        "claude-3-7-sonnet": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-            tier=ModelTier.ULTRA,
-            temperature=1.0,
-            description="Highest-performance Claude 3.7 Sonnet model with thinking support",
-            supports_thinking=True
-        ),
-        
-        # EU Region Models (for EU compliance)
-        "claude-3-5-haiku-eu": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="eu.anthropic.claude-3-5-haiku-20241022-v1:0",
-            tier=ModelTier.LIGHTWEIGHT,
-            temperature=1.0,
-            region="eu-central-1",
-            description="EU region Claude 3.5 Haiku model",
-            supports_thinking=False
-        ),
-        
-        "claude-3-5-sonnet-v2-eu": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="eu.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            tier=ModelTier.STANDARD,
-            temperature=1.0,
-            region="eu-central-1",
-            description="EU region Claude 3.5 Sonnet v2 model",
-            supports_thinking=False
-        ),
-        
-        "claude-4-opus-eu": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="eu.anthropic.claude-opus-4-20250514-v1:0",
-            tier=ModelTier.HEAVY,
-            temperature=1.0,
-            region="eu-central-1",
-            description="EU region Claude 4 Opus model",
-            supports_thinking=True
-        ),
-        
-        "claude-4-1-opus-eu": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="eu.anthropic.claude-opus-4-1-20250805-v1:0",
-            tier=ModelTier.HEAVY,
-            temperature=1.0,
-            region="eu-central-1",
-            description="EU region Claude 4.1 Opus model",
-            supports_thinking=True
-        ),
-        
-        "claude-3-7-sonnet-eu": ModelConfig(
-            provider=ModelProvider.BEDROCK_ANTHROPIC,
-            model_id="eu.anthropic.claude-3-7-sonnet-20250219-v1:0",
-            tier=ModelTier.ULTRA,
-            temperature=1.0,
-            region="eu-central-1",
-            description="EU region Claude 3.7 Sonnet model with thinking support",
-            supports_thinking=True
+    # Pre-defined model configurations, with EU region models derived from the US ones
+    MODEL_PRESETS = MappingProxyType({
+        **_US_MODEL_PRESETS,
+        **dict(
+            _eu_mirror(name, _US_MODEL_PRESETS[name], description)
+            for name, description in _EU_MIRROR_DESCRIPTIONS.items()
         )
-    }
+    })
     
     # Default agents configuration - modify this to add/remove agents dynamically
-    DEFAULT_AGENTS = [
+    DEFAULT_AGENTS = (
         "assistant",
         "supervisor",
         "singlecell_expert_agent",
@@ -218,8 +242,11 @@ class LobsterAgentConfigurator:
         "machine_learning_expert_agent",
         "visualization_expert_agent",
         "ms_proteomics_expert_agent",
-        "affinity_proteomics_expert_agent"
-    ]
+        "affinity_proteomics_expert_agent",
+    )
+
+    # Per-agent LOBSTER_<AGENT>_ override prefixes, computed once
+    _OVERRIDE_PREFIXES = {agent_name: f'LOBSTER_{agent_name.upper()}_' for agent_name in DEFAULT_AGENTS}
     
     # Thinking configuration presets
     THINKING_PRESETS = {
@@ -277,6 +304,15 @@ class LobsterAgentConfigurator:
             "thinking": {}  # No thinking for cost optimization
         }
     }
+
+    # Suffixes of the LOBSTER_* variables read by _apply_env_overrides
+    _OVERRIDE_SUFFIXES = ('_MODEL', '_TEMPERATURE', '_THINKING', '_THINKING_ENABLED', '_THINKING_BUDGET')
+
+    # Read-only view handed out by list_available_profiles
+    _PROFILES_VIEW = MappingProxyType(TESTING_PROFILES)
+
+    # Profiles resolved into agent configurations (populated after class creation)
+    _RESOLVED_PROFILES: Dict[str, Dict[str, AgentModelConfig]] = {}
     
     def __init__(self, profile: str = None):
         """
@@ -286,105 +322,172 @@ class LobsterAgentConfigurator:
             profile: Testing profile name (e.g., 'development', 'production')
             config_file: Path to custom configuration file
         """
+        _ensure_dotenv_loaded()
+
         # Note: Environment variables still use LOBSTER_ prefix for backward compatibility
         self.profile = profile or os.environ.get('LOBSTER_PROFILE', 'production')
         self._agent_configs = {}
+        self._llm_params_cache: Dict[str, Dict] = {}
         self._load_from_profile()
         
         # Apply environment overrides
         self._apply_env_overrides()
     
+    @classmethod
+    def _build_resolved_profiles(cls) -> Dict[str, Dict[str, AgentModelConfig]]:
+        """
+        Resolve every testing profile into agent configurations once.
+
+        Profiles and presets are static class data, so preset lookups and
+        thinking resolution are done here at import time rather than on
+        every configurator instantiation.
+
+        Returns:
+            Mapping of profile name to resolved per-agent configurations
+
+        Raises:
+            ValueError: If any profile references an unknown model preset
+        """
+        # Validate every profile up front so all bad references surface together
+        unknown = sorted(
+            (profile_name, model_preset)
+            for profile_name, profile_config in cls.TESTING_PROFILES.items()
+            for agent_name, model_preset in profile_config.items()
+            if agent_name != 'thinking' and model_preset not in cls.MODEL_PRESETS
+        )
+        if unknown:
+            raise ValueError(f"Unknown model presets referenced in TESTING_PROFILES: {unknown}")
+
+        resolved = {}
+        for profile_name, profile_config in cls.TESTING_PROFILES.items():
+            thinking_settings = profile_config.get('thinking', {})
+            agents = {}
+            for agent_name, model_preset in profile_config.items():
+                if agent_name == 'thinking':
+                    continue  # Skip thinking configuration here
+
+                model_config = cls.MODEL_PRESETS[model_preset]
+
+                # Initialize thinking config if specified in profile
+                thinking_config = None
+                if agent_name in thinking_settings:
+                    thinking_preset = thinking_settings[agent_name]
+                    if thinking_preset in cls.THINKING_PRESETS:
+                        thinking_config = cls.THINKING_PRESETS[thinking_preset]
+                    elif isinstance(thinking_preset, dict):
+                        thinking_config = ThinkingConfig(**thinking_preset)
+
+                    # Only apply thinking if model supports it
+                    if thinking_config and not model_config.supports_thinking:
+                        thinking_config = None
+
+                agents[agent_name] = AgentModelConfig(
+                    name=agent_name,
+                    model_config=model_config,
+                    thinking_config=thinking_config
+                )
+            resolved[profile_name] = agents
+        return resolved
+
     def _load_from_profile(self):
         """Load configuration from a testing profile."""
-        if self.profile not in self.TESTING_PROFILES:
+        resolved_profile = self._RESOLVED_PROFILES.get(self.profile)
+        if resolved_profile is None:
             raise ValueError(f"Unknown profile: {self.profile}. Available: {list(self.TESTING_PROFILES.keys())}")
-        
-        profile_config = self.TESTING_PROFILES[self.profile]
-        
-        # Load model configurations
-        for agent_name, model_preset in profile_config.items():
-            if agent_name == 'thinking':
-                continue  # Skip thinking configuration here
-                
-            if model_preset not in self.MODEL_PRESETS:
-                raise ValueError(f"Unknown model preset: {model_preset}")
-            
-            model_config = self.MODEL_PRESETS[model_preset]
-            
-            # Initialize thinking config if specified in profile
-            thinking_config = None
-            if 'thinking' in profile_config and agent_name in profile_config['thinking']:
-                thinking_preset = profile_config['thinking'][agent_name]
-                if thinking_preset in self.THINKING_PRESETS:
-                    thinking_config = self.THINKING_PRESETS[thinking_preset]
-                elif isinstance(thinking_preset, dict):
-                    thinking_config = ThinkingConfig(**thinking_preset)
-                
-                # Only apply thinking if model supports it
-                if thinking_config and not model_config.supports_thinking:
-                    thinking_config = None
-            
-            self._agent_configs[agent_name] = AgentModelConfig(
-                name=agent_name,
-                model_config=model_config,
-                thinking_config=thinking_config
+
+        # Copy the resolved entries so env overrides never mutate shared state;
+        # model and thinking configs are frozen and shared until overridden
+        self._agent_configs = {
+            agent_name: AgentModelConfig(
+                name=config.name,
+                model_config=config.model_config,
+                fallback_model=config.fallback_model,
+                enabled=config.enabled,
+                custom_params=dict(config.custom_params),
+                thinking_config=config.thinking_config
             )
+            for agent_name, config in resolved_profile.items()
+        }
     
+    def _invalidate_llm_cache(self, agent_name: Optional[str] = None):
+        """
+        Drop cached LLM parameters.
+
+        Dropping all agents also re-reads provider credentials, which may
+        have changed in the environment since they were first snapshotted.
+
+        Args:
+            agent_name: Agent whose parameters to drop; all agents if None
+        """
+        if agent_name is None:
+            _provider_extras.cache_clear()
+            self._llm_params_cache.clear()
+        else:
+            self._llm_params_cache.pop(agent_name, None)
+
     def _apply_env_overrides(self):
         """Apply environment variable overrides."""
+        self._invalidate_llm_cache()
+
+        # Snapshot LOBSTER_* override variables in a single pass over the environment
+        lobster_env = {
+            key: value for key, value in os.environ.items()
+            if key.startswith('LOBSTER_') and key.endswith(self._OVERRIDE_SUFFIXES)
+        }
+        if not lobster_env:
+            return  # Common case: nothing to override
+
         # Global overrides
-        if os.environ.get('LOBSTER_GLOBAL_MODEL'):
-            model_preset = os.environ.get('LOBSTER_GLOBAL_MODEL')
-            if model_preset in self.MODEL_PRESETS:
-                for agent_config in self._agent_configs.values():
-                    agent_config.model_config = self.MODEL_PRESETS[model_preset]
-        
-        # Per-agent overrides
-        for agent_name in self._agent_configs:
-            env_key = f'LOBSTER_{agent_name.upper()}_MODEL'
-            if os.environ.get(env_key):
-                model_preset = os.environ.get(env_key)
-                if model_preset in self.MODEL_PRESETS:
-                    self._agent_configs[agent_name].model_config = self.MODEL_PRESETS[model_preset]
+        model_config = self.MODEL_PRESETS.get(lobster_env.get('LOBSTER_GLOBAL_MODEL'))
+        if model_config is not None:
+            for agent_config in self._agent_configs.values():
+                agent_config.model_config = model_config
         
-        # Temperature overrides
-        for agent_name in self._agent_configs:
-            env_key = f'LOBSTER_{agent_name.upper()}_TEMPERATURE'
-            if os.environ.get(env_key):
+        # Per-agent overrides, applied in a single pass
+        for agent_name, agent_config in self._agent_configs.items():
+            prefix = self._OVERRIDE_PREFIXES.get(agent_name) or f'LOBSTER_{agent_name.upper()}_'
+
+            # Model override
+            model_config = self.MODEL_PRESETS.get(lobster_env.get(prefix + 'MODEL'))
+            if model_config is not None:
+                agent_config.model_config = model_config
+
+            # Temperature override
+            value = lobster_env.get(prefix + 'TEMPERATURE')
+            if value:
                 try:
-                    temperature = float(os.environ.get(env_key))
-                    self._agent_configs[agent_name].model_config.temperature = temperature
+                    temperature = float(value)
+                    if temperature != agent_config.model_config.temperature:
+                        agent_config.model_config = replace(agent_config.model_config, temperature=temperature)
                 except ValueError:
                     pass
-        
-        # Thinking configuration overrides
-        for agent_name in self._agent_configs:
+
             # Enable/disable thinking
-            env_key = f'LOBSTER_{agent_name.upper()}_THINKING_ENABLED'
-            if os.environ.get(env_key):
-                enabled = os.environ.get(env_key).lower() == 'true'
-                if enabled and self._agent_configs[agent_name].model_config.supports_thinking:
-                    if not self._agent_configs[agent_name].thinking_config:
-                        self._agent_configs[agent_name].thinking_config = ThinkingConfig()
-                    self._agent_configs[agent_name].thinking_config.enabled = True
+            value = lobster_env.get(prefix + 'THINKING_ENABLED')
+            if value:
+                enabled = value.lower() == 'true'
+                if enabled and agent_config.model_config.supports_thinking:
+                    if not agent_config.thinking_config:
+                        agent_config.thinking_config = ThinkingConfig(enabled=True)
+                    elif not agent_config.thinking_config.enabled:
+                        agent_config.thinking_config = replace(agent_config.thinking_config, enabled=True)
             
             # Thinking token budget
-            env_key = f'LOBSTER_{agent_name.upper()}_THINKING_BUDGET'
-            if os.environ.get(env_key):
+            value = lobster_env.get(prefix + 'THINKING_BUDGET')
+            if value:
                 try:
-                    budget = int(os.environ.get(env_key))
-                    if self._agent_configs[agent_name].thinking_config:
-                        self._agent_configs[agent_name].thinking_config.budget_tokens = budget
+                    budget = int(value)
+                    if agent_config.thinking_config and agent_config.thinking_config.budget_tokens != budget:
+                        agent_config.thinking_config = replace(agent_config.thinking_config, budget_tokens=budget)
                 except ValueError:
                     pass
         
         # Global thinking preset
-        if os.environ.get('LOBSTER_GLOBAL_THINKING'):
-            thinking_preset = os.environ.get('LOBSTER_GLOBAL_THINKING')
-            if thinking_preset in self.THINKING_PRESETS:
-                for agent_config in self._agent_configs.values():
-                    if agent_config.model_config.supports_thinking:
-                        agent_config.thinking_config = self.THINKING_PRESETS[thinking_preset]
+        thinking_config = self.THINKING_PRESETS.get(lobster_env.get('LOBSTER_GLOBAL_THINKING'))
+        if thinking_config is not None:
+            for agent_config in self._agent_configs.values():
+                if agent_config.model_config.supports_thinking:
+                    agent_config.thinking_config = thinking_config
     
     def get_agent_model_config(self, agent_name: str) -> AgentModelConfig:
         """
@@ -394,15 +497,18 @@ class LobsterAgentConfigurator:
             agent_name: Name of the agent
             
         Returns:
-            AgentModelConfig for the specified agent
+            A copy of the AgentModelConfig for the specified agent
             
         Raises:
             KeyError: If agent configuration not found
         """
-        if agent_name not in self._agent_configs:
+        agent_config = self._agent_configs.get(agent_name)
+        if agent_config is None:
             raise KeyError(f"No configuration found for agent: {agent_name}")
         
-        return self._agent_configs[agent_name]
+        # get_llm_params caches per agent, so callers must not be able to
+        # change the live config behind the cache
+        return replace(agent_config, custom_params=dict(agent_config.custom_params))
     
     def get_model_config(self, agent_name: str) -> ModelConfig:
         """
@@ -436,30 +542,38 @@ class LobsterAgentConfigurator:
         Args:
             agent_name: Name of the agent
             
+        Returns:
+            Dictionary of parameters for LLM initialization
+        """
+        cached = self._llm_params_cache.get(agent_name)
+        if cached is None:
+            cached = self._build_llm_params(agent_name)
+            self._llm_params_cache[agent_name] = cached
+
+        # Callers may add keys to the result, so never hand out the cached dict
+        return cached.copy()
+
+    def _build_llm_params(self, agent_name: str) -> Dict:
+        """
+        Assemble LLM initialization parameters for a specific agent.
+
+        Args:
+            agent_name: Name of the agent
+
         Returns:
             Dictionary of parameters for LLM initialization
         """
         agent_config = self.get_agent_model_config(agent_name)
         model_config = agent_config.model_config
         
-        # Base parameters
+        # Base parameters plus provider-specific parameters
         params = {
             "model_id": model_config.model_id,
             "temperature": model_config.temperature,
             "region_name": model_config.region,
+            **_provider_extras().get(model_config.provider, {}),
         }
         
-        # Add provider-specific parameters
-        if model_config.provider == ModelProvider.BEDROCK_ANTHROPIC:
-            params.update({
-                "aws_access_key_id": os.environ.get('AWS_BEDROCK_ACCESS_KEY'),
-                "aws_secret_access_key": os.environ.get('AWS_BEDROCK_SECRET_ACCESS_KEY'),
-            })
-        elif model_config.provider == ModelProvider.OPENAI:
-            params.update({
-                "openai_api_key": os.environ.get('OPENAI_API_KEY'),
-            })
-        
         # Add thinking configuration if enabled
         if agent_config.thinking_config and agent_config.thinking_config.enabled:
             thinking_params = agent_config.thinking_config.to_dict()
@@ -468,13 +582,13 @@ class LobsterAgentConfigurator:
         
         return params
     
-    def list_available_models(self) -> Dict[str, ModelConfig]:
-        """List all available model presets."""
-        return self.MODEL_PRESETS.copy()
+    def list_available_models(self) -> Mapping[str, ModelConfig]:
+        """List all available model presets (read-only view)."""
+        return self.MODEL_PRESETS
     
-    def list_available_profiles(self) -> Dict[str, Dict]:
-        """List all available testing profiles."""
-        return self.TESTING_PROFILES.copy()
+    def list_available_profiles(self) -> Mapping[str, Dict]:
+        """List all available testing profiles (read-only view)."""
+        return self._PROFILES_VIEW
     
     def list_thinking_presets(self) -> Dict[str, ThinkingConfig]:
         """List all available thinking presets."""
@@ -517,31 +631,41 @@ class LobsterAgentConfigurator:
                 } if agent_config.thinking_config else None
             }
         
-        with open(filepath, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        Path(filepath).write_bytes(_dumps_json(config_data))
     
     def print_current_config(self):
         """Print current configuration in a readable format."""
-        print("\n🔧 Lobster AI Configuration")
-        print(f"Profile: {self.profile}")
-        print(f"{'='*60}")
+        lines = [
+            "\n🔧 Lobster AI Configuration",
+            f"Profile: {self.profile}",
+            f"{'='*60}",
+        ]
         
         for agent_name, agent_config in self._agent_configs.items():
             model = agent_config.model_config
-            print(f"\n🤖 {agent_name.title()}")
-            print(f"   Model: {model.model_id}")
-            print(f"   Tier: {model.tier.value}")
-            print(f"   Region: {model.region}")
-            print(f"   Temperature: {model.temperature}")
+            lines.extend([
+                f"\n🤖 {agent_name.title()}",
+                f"   Model: {model.model_id}",
+                f"   Tier: {model.tier.value}",
+                f"   Region: {model.region}",
+                f"   Temperature: {model.temperature}",
+            ])
             if model.description:
-                print(f"   Description: {model.description}")
+                lines.append(f"   Description: {model.description}")
             if agent_config.thinking_config and agent_config.thinking_config.enabled:
-                print(f"   🧠 Thinking: Enabled (Budget: {agent_config.thinking_config.budget_tokens} tokens)")
+                lines.append(f"   🧠 Thinking: Enabled (Budget: {agent_config.thinking_config.budget_tokens} tokens)")
             elif model.supports_thinking:
-                print("   🧠 Thinking: Available but disabled")
+                lines.append("   🧠 Thinking: Available but disabled")
+
+        # Emit the whole report in one write
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# Resolve testing profiles once at import time
+LobsterAgentConfigurator._RESOLVED_PROFILES = LobsterAgentConfigurator._build_resolved_profiles()
 
 # Singleton instance
 _configurator = None
+_configurator_lock = threading.Lock()
 
 def get_agent_configurator() -> LobsterAgentConfigurator:
     """
@@ -552,7 +676,9 @@ def get_agent_configurator() -> LobsterAgentConfigurator:
     """
     global _configurator
     if _configurator is None:
-        _configurator = LobsterAgentConfigurator()
+        with _configurator_lock:
+            if _configurator is None:
+                _configurator = LobsterAgentConfigurator()
     return _configurator
 
 def initialize_configurator(profile: str = None) -> LobsterAgentConfigurator:
@@ -567,5 +693,9 @@ def initialize_configurator(profile: str = None) -> LobsterAgentConfigurator:
         LobsterAgentConfigurator instance
     """
     global _configurator
-    _configurator = LobsterAgentConfigurator(profile=profile)
-    return _configurator
+    # Pick up credentials changed since the previous configurator
+    _provider_extras.cache_clear()
+    configurator = LobsterAgentConfigurator(profile=profile)
+    with _configurator_lock:
+        _configurator = configurator
+    return configurator
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Union
 import anndata
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from lobster.core.interfaces.adapter import IModalityAdapter
 from lobster.core.interfaces.validator import ValidationResult
@@ -29,6 +30,11 @@ class BaseAdapter(IModalityAdapter):
     Subclasses need only implement the modality-specific methods.
     """
 
+    # Matrices with fewer non-zero entries than this fraction are stored as CSR
+    SPARSE_DENSITY_THRESHOLD = 0.3
+    # Rows sampled to estimate matrix density
+    DENSITY_SAMPLE_ROWS = 1000
+
     def __init__(self, name: Optional[str] = None):
         """
         Initialize the base adapter.
@@ -127,7 +133,8 @@ class BaseAdapter(IModalityAdapter):
         df: pd.DataFrame,
         obs_metadata: Optional[pd.DataFrame] = None,
         var_metadata: Optional[pd.DataFrame] = None,
-        transpose: bool = False
+        transpose: bool = False,
+        sparsify: bool = False
     ) -> anndata.AnnData:
         """
         Create AnnData object from pandas DataFrame.
@@ -137,6 +144,7 @@ class BaseAdapter(IModalityAdapter):
             obs_metadata: Optional observation metadata
             var_metadata: Optional variable metadata
             transpose: Whether to transpose the matrix (genes as rows)
+            sparsify: Store X as CSR if it is mostly zeros (single-cell counts)
 
         Returns:
             anndata.AnnData: Created AnnData object
@@ -152,9 +160,24 @@ class BaseAdapter(IModalityAdapter):
                 self.logger.warning(f"Dropping {df.shape[1] - numeric_df.shape[1]} non-numeric columns")
                 df = numeric_df
             
+            # Convert straight to float32 in one pass; df.values would first
+            # build a common-dtype (often float64) array for mixed-dtype frames
+            X = df.to_numpy(dtype=np.float32, copy=True)
+            
+            # Mostly-zero matrices (typical for single-cell counts) are stored
+            # sparse, cutting memory and downstream scans by ~1/density
+            if sparsify:
+                X = self._sparsify_if_sparse(X)
+            
+            # Keep a dense X column-major so per-gene scans (HVG, PCA, gene
+            # statistics) read contiguous memory; pandas' block layout usually
+            # yields this already, in which case no copy is made
+            if isinstance(X, np.ndarray):
+                X = np.asfortranarray(X)
+            
             # Create basic AnnData object
             adata = anndata.AnnData(
-                X=df.values.astype(np.float32),
+                X=X,
                 obs=obs_metadata if obs_metadata is not None else pd.DataFrame(index=df.index),
                 var=var_metadata if var_metadata is not None else pd.DataFrame(index=df.columns)
             )
@@ -165,6 +188,51 @@ class BaseAdapter(IModalityAdapter):
         except Exception as e:
             raise ValueError(f"Failed to create AnnData from DataFrame: {e}")
 
+    def _sparsify_if_sparse(self, X: np.ndarray) -> Union[np.ndarray, sparse.csr_matrix]:
+        """
+        Convert a dense matrix to CSR when it is mostly zeros.
+
+        Density is estimated on up to DENSITY_SAMPLE_ROWS evenly spaced rows.
+
+        Args:
+            X: Dense expression matrix
+
+        Returns:
+            Union[np.ndarray, sparse.csr_matrix]: CSR matrix if density is below
+                SPARSE_DENSITY_THRESHOLD, otherwise X unchanged
+        """
+        if X.size == 0:
+            return X
+        
+        step = max(1, X.shape[0] // self.DENSITY_SAMPLE_ROWS)
+        sample = X[::step]
+        density = np.count_nonzero(sample) / sample.size
+        if density >= self.SPARSE_DENSITY_THRESHOLD:
+            return X
+        
+        self.logger.info(f"Storing matrix as CSR (estimated density {density:.1%})")
+        return sparse.csr_matrix(X)
+
+    @staticmethod
+    def _density(X: Any) -> float:
+        """
+        Fraction of non-zero entries in a dense or sparse matrix.
+
+        For sparse matrices X.size counts only stored entries, so the total
+        is taken from the shape and explicit zeros are not counted.
+
+        Args:
+            X: Expression matrix
+
+        Returns:
+            float: Non-zero fraction, or 0.0 for empty matrices
+        """
+        n_total = int(np.prod(X.shape)) if hasattr(X, 'shape') else 0
+        if n_total == 0:
+            return 0.0
+        nonzero = X.count_nonzero() if sparse.issparse(X) else np.count_nonzero(X)
+        return float(nonzero / n_total)
+
     def _ensure_numeric_matrix(self, adata: anndata.AnnData) -> anndata.AnnData:
         """
         Ensure the expression matrix contains only numeric values.
@@ -206,19 +274,20 @@ class BaseAdapter(IModalityAdapter):
         Returns:
             anndata.AnnData: AnnData with basic metadata
         """
-        # Add basic observation metadata if missing
+        # Add basic observation metadata if missing (reductions over a
+        # sparse X return 2-D np.matrix objects, hence the ravel)
         if 'n_genes' not in adata.obs.columns:
-            adata.obs['n_genes'] = (adata.X > 0).sum(axis=1)
+            adata.obs['n_genes'] = np.asarray((adata.X > 0).sum(axis=1)).ravel()
         
         if 'total_counts' not in adata.obs.columns:
-            adata.obs['total_counts'] = adata.X.sum(axis=1)
+            adata.obs['total_counts'] = np.asarray(adata.X.sum(axis=1)).ravel()
         
         # Add basic variable metadata if missing
         if 'n_cells' not in adata.var.columns:
-            adata.var['n_cells'] = (adata.X > 0).sum(axis=0)
+            adata.var['n_cells'] = np.asarray((adata.X > 0).sum(axis=0)).ravel()
         
         if 'mean_counts' not in adata.var.columns:
-            adata.var['mean_counts'] = adata.X.mean(axis=0)
+            adata.var['mean_counts'] = np.asarray(adata.X.mean(axis=0)).ravel()
         
         # Add source information to uns
         if source_path:
@@ -319,7 +388,7 @@ class BaseAdapter(IModalityAdapter):
                 "mean_counts_per_var": float(var_sums.mean()),
                 "zero_obs": int((obs_sums == 0).sum()),
                 "zero_vars": int((var_sums == 0).sum()),
-                "density": float(1.0 - (adata.X == 0).sum() / adata.X.size) if hasattr(adata.X, 'size') else 0.0
+                "density": self._density(adata.X)
             })
         
         return metrics
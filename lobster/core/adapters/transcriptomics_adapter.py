@@ -114,7 +114,8 @@ class TranscriptomicsAdapter(BaseAdapter):
                 adata = self._create_anndata_from_dataframe(
                     df = source, 
                     obs_metadata=dataframe_params.get('obs_metadata'),
-                    var_metadata=dataframe_params.get('var_metadata')
+                    var_metadata=dataframe_params.get('var_metadata'),
+                    sparsify=self.data_type == "single_cell"
                     )
             elif isinstance(source, (str, Path)):
                 adata = self._load_from_file(source, **kwargs)
@@ -213,7 +214,8 @@ class TranscriptomicsAdapter(BaseAdapter):
         adata = self._create_anndata_from_dataframe(
             df,
             var_metadata=var_metadata,
-            transpose=transpose
+            transpose=transpose,
+            sparsify=self.data_type == "single_cell"
         )
         
         return adata
@@ -233,7 +235,9 @@ class TranscriptomicsAdapter(BaseAdapter):
         
         df = self._load_excel_data(path, sheet_name=sheet_name, index_col=0, **excel_params)
         
-        return self._create_anndata_from_dataframe(df, transpose=transpose)
+        return self._create_anndata_from_dataframe(
+            df, transpose=transpose, sparsify=self.data_type == "single_cell"
+        )
 
     def _load_h5_transcriptomics_data(
         self, 
@@ -250,7 +254,9 @@ class TranscriptomicsAdapter(BaseAdapter):
             key = kwargs.get('key', 'expression_data')
             df = pd.read_hdf(path, key=key)
             transpose = kwargs.get('transpose', True)
-            return self._create_anndata_from_dataframe(df, transpose=transpose)
+            return self._create_anndata_from_dataframe(
+                df, transpose=transpose, sparsify=self.data_type == "single_cell"
+            )
 
     def _load_mtx_data(
         self, 
@@ -411,14 +417,14 @@ class TranscriptomicsAdapter(BaseAdapter):
         if self.data_type == "single_cell":
             # Add cell metrics if not present
             if 'n_genes_by_counts' not in adata.obs.columns:
-                adata.obs['n_genes_by_counts'] = (adata.X > 0).sum(axis=1)
+                adata.obs['n_genes_by_counts'] = np.array((adata.X > 0).sum(axis=1)).flatten()
             
             if 'total_counts' not in adata.obs.columns:
                 adata.obs['total_counts'] = np.array(adata.X.sum(axis=1)).flatten()
         
         # Calculate per-gene metrics
         if 'n_cells_by_counts' not in adata.var.columns:
-            adata.var['n_cells_by_counts'] = (adata.X > 0).sum(axis=0)
+            adata.var['n_cells_by_counts'] = np.array((adata.X > 0).sum(axis=0)).flatten()
         
         if 'mean_counts' not in adata.var.columns:
             adata.var['mean_counts'] = np.array(adata.X.mean(axis=0)).flatten()
@@ -520,10 +526,7 @@ class TranscriptomicsAdapter(BaseAdapter):
         n_vars = adata.n_vars
         
         # Calculate sparsity
-        if hasattr(adata.X, 'nnz'):
-            sparsity = 1.0 - (adata.X.nnz / adata.X.size)
-        else:
-            sparsity = 1.0 - (adata.X != 0).sum() / adata.X.size
+        sparsity = 1.0 - self._density(adata.X)
         
         # Single-cell typically has:
         # - Many observations (cells)
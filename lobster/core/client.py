@@ -3,28 +3,123 @@ Clean Agent Client Interface for LangGraph Multi-Agent System.
 Provides a simple, extensible interface for both CLI and future UI implementations.
 """
 
+import asyncio
+import contextlib
 import os
+import fnmatch
+import locale
 import logging
+import mmap
+import re
+import stat
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, AsyncGenerator, Tuple
 from datetime import datetime
-import json
+from functools import lru_cache
 
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.store.memory import InMemoryStore
 
-from langfuse.langchain import CallbackHandler as LangfuseCallback
-
 from lobster.core.data_manager_v2 import DataManagerV2
 from lobster.core.interfaces.base_client import BaseClient
 from lobster.agents.graph import create_bioinformatics_graph
+from lobster.utils.json_io import dumps_json
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Files at least this large are read through a memory map in read_file
+MMAP_READ_THRESHOLD = 4 * 1024 * 1024
+
+
+def _read_text_fast(path: Path, threshold: int = MMAP_READ_THRESHOLD) -> str:
+    """
+    Read a text file, decoding large files straight from a memory map.
+    
+    Decoding from the map avoids holding a full bytes copy of the file
+    alongside the decoded string. Encoding and newline handling match
+    Path.read_text().
+    """
+    if path.stat().st_size < threshold:
+        return path.read_text()
+    
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, locale.getpreferredencoding(False))
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+_langfuse_callback_cls = None
+
+
+def _get_langfuse_callback_cls():
+    """Import the Langfuse callback handler on first use."""
+    global _langfuse_callback_cls
+    if _langfuse_callback_cls is None:
+        from langfuse.langchain import CallbackHandler
+        _langfuse_callback_cls = CallbackHandler
+    return _langfuse_callback_cls
+
+
+# Directory listings younger than this (1 s) are not cached, to cover
+# filesystems with coarse mtime resolution
+DIR_CACHE_SETTLE_NS = 1_000_000_000
+
+
+@lru_cache(maxsize=128)
+def _glob_matcher(pattern: str):
+    """
+    Compile a glob pattern into a name matcher.
+    
+    Like fnmatch.fnmatch, both sides go through os.path.normcase, so
+    matching is case-insensitive on Windows and case-sensitive elsewhere.
+    """
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    return lambda name: match(os.path.normcase(name))
+
+
+# Graph updates buffered between the producer and consumer in astream_query
+STREAM_QUEUE_SIZE = 16
+
+# Node output fields shown in the stream when a node has no AI message
+_FALLBACK_CONTENT_KEYS = ("analysis_results", "next", "data_context")
+
+# Conversation role for each message class
+_ROLE_MAP = {HumanMessage: "user", AIMessage: "assistant"}
+
+
+def _message_role(msg: BaseMessage) -> str:
+    """Return the conversation role of a message."""
+    role = _ROLE_MAP.get(type(msg))
+    if role is not None:
+        return role
+    # Subclasses such as message chunks
+    if isinstance(msg, HumanMessage):
+        return "user"
+    if isinstance(msg, AIMessage):
+        return "assistant"
+    return "system"
+
 
 class AgentClient(BaseClient):
+    __slots__ = (
+        "session_id",
+        "enable_reasoning",
+        "workspace_path",
+        "data_manager",
+        "callbacks",
+        "checkpointer",
+        "store",
+        "graph",
+        "_base_config",
+        "_dir_index",
+        "messages",
+        "metadata"
+    )
+    
     def __init__(
         self,
         data_manager: Optional[DataManagerV2] = None,
@@ -33,7 +128,8 @@ class AgentClient(BaseClient):
         enable_langfuse: bool = False,
         workspace_path: Optional[Path] = None,
         custom_callbacks: Optional[List] = None,
-        manual_model_params: Optional[Dict[str, Any]] = None
+        manual_model_params: Optional[Dict[str, Any]] = None,
+        enable_checkpointing: bool = True
     ):
         """
         Initialize the agent client with DataManagerV2.
@@ -46,9 +142,12 @@ class AgentClient(BaseClient):
             workspace_path: Path to workspace for file operations
             custom_callbacks: Additional callback handlers
             manual_model_params: Manual model parameter overrides
+            enable_checkpointing: Keep graph state between queries; disable
+                for one-shot runs where every query stands alone
         """
         # Set up session
-        self.session_id = session_id or f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Nanosecond clock keeps ids unique for clients created in the same second
+        self.session_id = session_id or f"session_{time.time_ns():x}"
         self.enable_reasoning = enable_reasoning
         
         # Set up workspace
@@ -70,11 +169,11 @@ class AgentClient(BaseClient):
         # Set up callbacks
         self.callbacks = []
         if enable_langfuse and os.getenv("LANGFUSE_PUBLIC_KEY"):
-            self.callbacks.append(LangfuseCallback())
+            self.callbacks.append(_get_langfuse_callback_cls()())
         if custom_callbacks:
             self.callbacks.extend(custom_callbacks)
         
-        self.checkpointer = InMemorySaver()
+        self.checkpointer = InMemorySaver() if enable_checkpointing else None
         self.store = InMemoryStore()
         # Initialize graph - pass all callbacks
         self.graph = create_bioinformatics_graph(
@@ -85,6 +184,17 @@ class AgentClient(BaseClient):
             manual_model_params=manual_model_params  # Placeholder for future manual model params
         )        
         
+        # Run config shared by every query of this session
+        self._base_config: Dict[str, Any] = {
+            "configurable": {"thread_id": self.session_id},
+            "callbacks": self.callbacks,
+            "recursion_limit": 100  # Prevent hitting default limit of 25
+        }
+        
+        # Directory -> (mtime_ns, {filename: path}) listings shared by
+        # read_file and list_workspace_files
+        self._dir_index: Dict[Path, tuple] = {}
+        
         # Conversation state
         self.messages: List[BaseMessage] = []
         self.metadata: Dict[str, Any] = {
@@ -102,139 +212,237 @@ class AgentClient(BaseClient):
             stream: Whether to stream the response
             
         Returns:
-            Dictionary with response and metadata
+            Dictionary with response and metadata, or the query_stream
+            generator when stream is True
         """
-        # Add user message
-        self.messages.append(HumanMessage(content=user_input))
+        if stream:
+            return self.query_stream(user_input)
+        return self._run_query(self.query_stream(user_input))
+    
+    def query_stream(self, user_input: str) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+        """
+        Process a user query, yielding intermediate results as they arrive.
         
-        # Prepare graph input
-        graph_input = {
-            "messages": [HumanMessage(content=user_input)]
-        }
+        The consumer may stop iterating at any point to abandon the run.
+        Once exhausted, the generator returns the same result dictionary
+        that query() produces.
         
-        config = {
-            "configurable": {"thread_id": self.session_id},
-            "callbacks": self.callbacks,
-            "recursion_limit": 100  # Prevent hitting default limit of 25
-        }
+        Args:
+            user_input: User's input text
+            
+        Yields:
+            "stream" events for node outputs (with a wall-clock "timestamp"
+            and the seconds "elapsed" since the start), then a "complete" or
+            "error" event
+        """
+        graph_input = self._prepare_query(user_input)
+        return (yield from self._stream_query(graph_input, self._base_config))
+    
+    async def astream_query(self, user_input: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Asynchronously process a user query, yielding intermediate results.
         
-        if stream:
-            return self._stream_query(graph_input, config)
-        else:
-            return self._run_query(graph_input, config)
+        Graph updates are pulled by a producer task into a bounded queue
+        (STREAM_QUEUE_SIZE), so the graph keeps making progress on model
+        calls while earlier updates are being extracted and consumed.
+        Closing the generator early cancels the producer.
+        
+        Args:
+            user_input: User's input text
+            
+        Yields:
+            The same events as query_stream
+        """
+        graph_input = self._prepare_query(user_input)
+        run = self._new_run()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        finished = object()
+        
+        async def produce():
+            try:
+                async for event in self.graph.astream(
+                    input=graph_input,
+                    config=self._base_config,
+                    stream_mode='updates'
+                    ):
+                    await queue.put(event)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(finished)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (event := await queue.get()) is not finished:
+                if isinstance(event, Exception):
+                    raise event
+                for chunk in self._process_update(event, run):
+                    yield chunk
+            
+            complete, _ = self._finish_run(run)
+            yield complete
+            
+        except Exception as e:
+            error, _ = self._failed_run(e)
+            yield error
+        
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+    
+    def _prepare_query(self, user_input: str) -> Dict[str, Any]:
+        """Record the user message and build the graph input for it."""
+        # Add user message; the graph receives the same message object
+        message = HumanMessage(content=user_input)
+        self.messages.append(message)
+        
+        return {
+            "messages": [message]
+        }
     
-    def _run_query(self, graph_input: Dict, config: Dict) -> Dict[str, Any]:
-        """Run a query and return the complete response."""
+    def _run_query(self, stream: Generator[Dict[str, Any], None, Dict[str, Any]]) -> Dict[str, Any]:
+        """Drain a query stream and return its complete response."""
+        while True:
+            try:
+                next(stream)
+            except StopIteration as stop:
+                return stop.value
+    
+    def _stream_query(self, graph_input: Dict, config: Dict) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+        """Stream query execution with intermediate results."""
         try:
-            # Track execution
-            start_time = datetime.now()
-            events = []
-            last_agent = None
+            run = self._new_run()
             
-            # Execute graph
+            # Execute graph, keeping only the latest supervisor response
             for event in self.graph.stream(
                 input=graph_input, 
                 config=config,
                 stream_mode='updates'
                 ):
-                events.append(event)
-                
-                # Track which agent is responding
-                if event:
-                    for node_name in event.keys():
-                        if node_name and node_name != '__end__':
-                            last_agent = node_name
-            
-            # Extract final response from the last event
-            final_response = self._extract_response(events)
+                yield from self._process_update(event, run)
             
-            # Update messages with the final response (not the raw events)
-            if final_response:
-                self.messages.append(AIMessage(content=final_response))
-            
-            return {
-                "success": True,
-                "response": final_response,
-                "duration": (datetime.now() - start_time).total_seconds(),
-                "events_count": len(events),
-                "session_id": self.session_id,
-                "has_data": self.data_manager.has_data(),
-                "plots": self.data_manager.get_latest_plots(5) if self.data_manager.has_data() else [],
-                "last_agent": last_agent  # Include which agent provided the response
-            }
+            complete, result = self._finish_run(run)
+            yield complete
+            return result
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "response": f"I encountered an error: {str(e)}",
-                "session_id": self.session_id
-            }
+            error, result = self._failed_run(e)
+            yield error
+            return result
     
-    def _stream_query(self, graph_input: Dict, config: Dict) -> Generator[Dict[str, Any], None, None]:
-        """Stream query execution with intermediate results."""
-        try:
-            start_time = datetime.now()
-            
-            for event in self.graph.stream(graph_input, config):
-                # Process each event
-                for node_name, node_output in event.items():
-                    # Extract meaningful content
-                    content = self._extract_event_content(node_output)
-                    
-                    if content:
-                        yield {
-                            "type": "stream",
-                            "node": node_name,
-                            "content": content,
-                            "timestamp": datetime.now().isoformat()
-                        }
+    def _new_run(self) -> Dict[str, Any]:
+        """Create the bookkeeping state for one query run."""
+        return {
+            "start_time": time.monotonic(),
+            "events_count": 0,
+            "last_agent": None,
+            "final_response": None
+        }
+    
+    def _process_update(self, event: Dict, run: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Record one graph update in the run state and return its stream events."""
+        run["events_count"] += 1
+        chunks = []
+        
+        # Process each event
+        for node_name, node_output in event.items():
+            # Track which agent is responding
+            if node_name and node_name != '__end__':
+                run["last_agent"] = node_name
             
-            # Final response
-            yield {
-                "type": "complete",
-                "duration": (datetime.now() - start_time).total_seconds(),
-                "session_id": self.session_id
-            }
+            # Extract meaningful content
+            content = self._extract_event_content(node_output)
             
-        except Exception as e:
-            yield {
+            if content:
+                chunks.append({
+                    "type": "stream",
+                    "node": node_name,
+                    "content": content,
+                    "timestamp": datetime.now().isoformat(),
+                    "elapsed": time.monotonic() - run["start_time"]
+                })
+        
+        response = self._extract_event_response(event)
+        if response:
+            run["final_response"] = response
+        
+        return chunks
+    
+    def _finish_run(self, run: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Record the final response and build the "complete" event and result."""
+        final_response = run["final_response"]
+        if final_response is None:
+            final_response = "No response generated."
+        
+        # Update messages with the final response (not the raw events)
+        self.messages.append(AIMessage(content=final_response))
+        
+        duration = time.monotonic() - run["start_time"]
+        has_data = self.data_manager.has_data()
+        
+        complete = {
+            "type": "complete",
+            "timestamp": datetime.now().isoformat(),
+            "duration": duration,
+            "session_id": self.session_id
+        }
+        result = {
+            "success": True,
+            "response": final_response,
+            "duration": duration,
+            "events_count": run["events_count"],
+            "session_id": self.session_id,
+            "has_data": has_data,
+            "plots": self.data_manager.get_latest_plots(5) if has_data else [],
+            "last_agent": run["last_agent"]  # Include which agent provided the response
+        }
+        return complete, result
+    
+    def _failed_run(self, error: Exception) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the "error" event and result for a failed run."""
+        return (
+            {
                 "type": "error",
-                "error": str(e),
+                "error": str(error),
+                "session_id": self.session_id
+            },
+            {
+                "success": False,
+                "error": str(error),
+                "response": f"I encountered an error: {str(error)}",
                 "session_id": self.session_id
             }
+        )
     
-    def _extract_response(self, events: List[Dict]) -> str:
-        """Extract the final response from events, expecting supervisor responses."""
-        if not events:
-            return "No response generated."
-        
-        # Process events in reverse chronological order to find the last supervisor response
-        for event in reversed(events):
-            # Check for supervisor key first
-            if 'supervisor' not in event:
-                # Log any unexpected keys
-                unexpected_keys = [key for key in event.keys() if key != 'supervisor']
-                if unexpected_keys:
-                    logger.warning(f"Unexpected event keys found (expected 'supervisor'): {unexpected_keys}")
-                continue
-            
-            supervisor_data = event['supervisor']
-            if not isinstance(supervisor_data, dict) or 'messages' not in supervisor_data:
-                continue
-                
-            messages = supervisor_data['messages']
-            if not isinstance(messages, list):
-                continue
+    def _extract_event_response(self, event: Dict) -> Optional[str]:
+        """Extract the supervisor response from a single graph update, if any."""
+        # Check for supervisor key first
+        if 'supervisor' not in event:
+            # Updates from other nodes are expected while streaming
+            if event:
+                logger.debug("Skipping non-supervisor update: %s", list(event.keys()))
+            return None
+        
+        supervisor_data = event['supervisor']
+        if not isinstance(supervisor_data, dict) or 'messages' not in supervisor_data:
+            return None
             
-            # Find the last AIMessage in the supervisor's messages
-            for msg in reversed(messages):
-                if isinstance(msg, AIMessage) and hasattr(msg, 'content') and msg.content:
-                    content = self._extract_content_from_message(msg.content)
+        messages = supervisor_data['messages']
+        if not isinstance(messages, list):
+            return None
+        
+        # Find the last AIMessage in the supervisor's messages
+        # (AIMessage always defines content, so no hasattr probe is needed)
+        for msg in reversed(messages):
+            if isinstance(msg, AIMessage):
+                raw_content = msg.content
+                if raw_content:
+                    content = self._extract_content_from_message(raw_content)
                     if content:
                         return content
         
-        return "No response generated."
+        return None
     
     def _extract_content_from_message(self, content) -> str:
         """Extract text content from a message, handling both string and list formats."""
@@ -279,16 +487,20 @@ class AgentClient(BaseClient):
             return None
         
         # Check for messages - only return content from AI messages
-        if "messages" in node_output and node_output["messages"]:
+        messages = node_output.get("messages")
+        if messages:
             # Look for the last AI message in this event
-            for msg in reversed(node_output["messages"]):
-                if isinstance(msg, AIMessage) and hasattr(msg, 'content') and msg.content:
-                    return self._extract_content_from_message(msg.content)
+            for msg in reversed(messages):
+                if isinstance(msg, AIMessage):
+                    raw_content = msg.content
+                    if raw_content:
+                        return self._extract_content_from_message(raw_content)
         
         # Check for other relevant fields
-        for key in ["analysis_results", "next", "data_context"]:
-            if key in node_output and node_output[key]:
-                return f"{key}: {node_output[key]}"
+        for key in _FALLBACK_CONTENT_KEYS:
+            value = node_output.get(key)
+            if value:
+                return f"{key}: {value}"
         
         return None
     
@@ -591,14 +803,39 @@ class AgentClient(BaseClient):
     def list_workspace_files(self, pattern: str = "*") -> List[Dict[str, Any]]:
         """List files in the workspace."""
         files = []
-        for path in self.workspace_path.glob(pattern):
-            if path.is_file():
-                files.append({
-                    "name": path.name,
-                    "path": str(path),
-                    "size": path.stat().st_size,
-                    "modified": datetime.fromtimestamp(path.stat().st_mtime).isoformat()
-                })
+        
+        # Patterns spanning directories need glob; plain name patterns are
+        # matched against the cached workspace listing (one stat per file)
+        if os.sep in pattern or (os.altsep and os.altsep in pattern) or "**" in pattern:
+            for path in self.workspace_path.glob(pattern):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    files.append({
+                        "name": path.name,
+                        "path": str(path),
+                        "size": st.st_size,
+                        "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+                    })
+            return files
+        
+        # Sizes and times are read fresh; only the listing itself is cached
+        match = _glob_matcher(pattern)
+        for name, path in self._scan(self.workspace_path).items():
+            if match(name):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    files.append({
+                        "name": name,
+                        "path": path,
+                        "size": st.st_size,
+                        "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+                    })
         return files
     
     def read_file(self, filename: str) -> Optional[str]:
@@ -611,36 +848,89 @@ class AgentClient(BaseClient):
         Returns:
             File content as string, or None if not found
         """
-        file_path = Path(filename)
-        
         # If it's an absolute path, try to read directly
-        if file_path.is_absolute():
-            if file_path.exists() and file_path.is_file():
+        if os.path.isabs(filename):
+            file_path = Path(filename)
+            if file_path.is_file():
                 try:
-                    return file_path.read_text()
+                    return _read_text_fast(file_path)
                 except Exception as e:
                     return f"Error reading file {file_path}: {e}"
             else:
                 return f"File not found: {file_path}"
         
         # For relative paths, search in workspace and data directories
-        search_paths = [
-            self.workspace_path / filename,
-            self.data_manager.data_dir / filename,
-            self.data_manager.workspace_path / "plots" / filename,
-            self.data_manager.exports_dir / filename,
-            self.data_manager.cache_dir / filename
-        ]
-        
-        for search_path in search_paths:
-            if search_path.exists() and search_path.is_file():
-                try:
-                    return search_path.read_text()
-                except Exception as e:
-                    return f"Error reading file: {e}"
+        search_path = self._lookup(filename)
+        if search_path is not None:
+            try:
+                return _read_text_fast(search_path)
+            except Exception as e:
+                return f"Error reading file: {e}"
         
         return f"File not found in workspace: {filename}"
     
+    def _lookup(self, filename: str) -> Optional[Path]:
+        """
+        Find a relative filename in the workspace search directories.
+        
+        Plain filenames are resolved through a per-directory index that is
+        rebuilt only when the directory's mtime changes. Names containing a
+        path separator, and names the index misses (e.g. a different letter
+        case on a case-insensitive filesystem), are checked directly.
+        
+        Args:
+            filename: Filename or relative path
+            
+        Returns:
+            Path of the first match, or None if not found
+        """
+        search_dirs = (
+            self.workspace_path,
+            self.data_manager.data_dir,
+            self.data_manager.workspace_path / "plots",
+            self.data_manager.exports_dir,
+            self.data_manager.cache_dir
+        )
+        
+        if not (os.sep in filename or (os.altsep and os.altsep in filename)):
+            for directory in search_dirs:
+                search_path = self._scan(directory).get(filename)
+                if search_path is not None:
+                    return Path(search_path)
+        
+        for directory in search_dirs:
+            search_path = directory / filename
+            if search_path.is_file():
+                return search_path
+        return None
+    
+    def _scan(self, directory: Path) -> Dict[str, str]:
+        """
+        Return {filename: path} for the files directly in a directory.
+        
+        Listings are cached per directory and reused while its mtime is
+        unchanged. A listing taken within DIR_CACHE_SETTLE_NS of the
+        directory's last change is not cached, since a further change in
+        the same timestamp tick would go unnoticed.
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return {}
+        
+        cached = self._dir_index.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name: entry.path for entry in it if entry.is_file()}
+        except OSError:
+            return {}
+        if time.time_ns() - mtime_ns > DIR_CACHE_SETTLE_NS:
+            self._dir_index[directory] = (mtime_ns, entries)
+        return entries
+    
     def write_file(self, filename: str, content: str) -> bool:
         """Write a file to the workspace."""
         try:
@@ -653,28 +943,22 @@ class AgentClient(BaseClient):
     # State management
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get formatted conversation history."""
-        history = []
-        for msg in self.messages:
-            if isinstance(msg, HumanMessage):
-                role = "user"
-            elif isinstance(msg, AIMessage):
-                role = "assistant"
-            else:
-                role = "system"
-            
-            history.append({
-                "role": role,
+        return [
+            {
+                "role": _message_role(msg),
                 "content": msg.content if hasattr(msg, 'content') else str(msg)
-            })
-        return history
+            }
+            for msg in self.messages
+        ]
     
     def get_status(self) -> Dict[str, Any]:
         """Get current client status."""
+        has_data = self.data_manager.has_data()
         return {
             "session_id": self.session_id,
             "message_count": len(self.messages),
-            "has_data": self.data_manager.has_data(),
-            "data_summary": self.data_manager.get_data_summary() if self.data_manager.has_data() else None,
+            "has_data": has_data,
+            "data_summary": self.data_manager.get_data_summary() if has_data else None,
             "workspace": str(self.workspace_path),
             "reasoning_enabled": self.enable_reasoning,
             "callbacks_count": len(self.callbacks)
@@ -682,7 +966,20 @@ class AgentClient(BaseClient):
     
     def reset(self):
         """Reset the conversation state."""
+        # Release the old messages now rather than leaving them to the
+        # cyclic collector (tool-call payloads often form cycles)
+        old_messages = self.messages
         self.messages = []
+        old_messages.clear()
+        del old_messages
+        
+        # The checkpointed thread holds the same conversation: the graph
+        # would otherwise keep every message alive and replay the pre-reset
+        # history into the next query on this session_id
+        delete_thread = getattr(self.checkpointer, "delete_thread", None)
+        if delete_thread is not None:
+            delete_thread(self.session_id)
+        
         self.metadata["reset_at"] = datetime.now().isoformat()
     
     def export_session(self, export_path: Optional[Path] = None) -> Path:
@@ -704,7 +1001,7 @@ class AgentClient(BaseClient):
             "exported_at": datetime.now().isoformat()
         }
         
-        with open(export_path, 'w') as f:
-            json.dump(session_data, f, indent=2, default=str)
+        with open(export_path, 'wb') as f:
+            f.write(dumps_json(session_data))
         
         return export_path
@@ -6,16 +6,20 @@ modality adapters, storage backends, and validation to enable
 flexible multi-omics data analysis with complete provenance tracking.
 """
 
+import fnmatch
 import json
 import logging
 import os
+import re
 import tempfile
 import threading
 import time
+import traceback
 import zipfile
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 
 import anndata
 import numpy as np
@@ -27,6 +31,7 @@ from lobster.core.interfaces.adapter import IModalityAdapter
 from lobster.core.interfaces.backend import IDataBackend
 from lobster.core.interfaces.validator import ValidationResult
 from lobster.core.provenance import ProvenanceTracker
+from lobster.utils.json_io import dumps_json
 
 # Import available backends and adapters
 from lobster.core.backends.h5ad_backend import H5ADBackend
@@ -50,6 +55,14 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Characters dropped from plot titles when building filenames (\w is alphanumerics plus "_")
+_SAFE_TITLE_RE = re.compile(r"[^\w \-]")
+
+
+def sanitize_plot_title(title: str) -> str:
+    """Reduce a plot title to the filename-safe form used for exported plot files."""
+    return _SAFE_TITLE_RE.sub("", title).rstrip().replace(" ", "_")
+
 
 class SuppressKaleidoLogging:
     """Context manager to temporarily suppress verbose Kaleido logging during image generation."""
@@ -119,9 +132,11 @@ class DataManagerV2:
         self.processing_log: List[str] = []
 
         # Plot management
-        self.latest_plots: List[Dict[str, Any]] = []  # Store plots with metadata
-        self.plot_counter: int = 0  # Counter for generating unique IDs
         self.max_plots_history: int = 50  # Maximum number of plots to keep in history
+        # Store plots with metadata; appending beyond the limit drops the oldest
+        self.latest_plots: Deque[Dict[str, Any]] = deque(maxlen=self.max_plots_history)
+        self._plot_index: Dict[str, Dict[str, Any]] = {}  # Plot ID -> entry in latest_plots
+        self.plot_counter: int = 0  # Counter for generating unique IDs
 
         # Safety mechanisms to prevent infinite loops and concurrent saves
         self._save_lock = threading.Lock()  # Prevent concurrent saves
@@ -710,9 +725,8 @@ class DataManagerV2:
         # Export provenance
         provenance_data = self.provenance.to_dict()
         
-        import json
-        with open(path, 'w') as f:
-            json.dump(provenance_data, f, indent=2, default=str)
+        with open(path, 'wb') as f:
+            f.write(dumps_json(provenance_data))
         
         logger.info(f"Exported provenance to {path}")
         return str(path)
@@ -782,13 +796,11 @@ class DataManagerV2:
             parameters: Parameters used with the tool
             description: Optional description of what was done
         """
-        import datetime
-        
         self.tool_usage_history.append({
             "tool": tool_name,
             "parameters": parameters,
             "description": description,
-            "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         })
         logger.info(f"Tool usage logged: {tool_name}")
 
@@ -817,7 +829,6 @@ class DataManagerV2:
 
         try:
             from lobster.utils.file_naming import BioinformaticsFileNaming
-            import json
             
             # Use the first modality if multiple exist
             modality_name = list(self.modalities.keys())[0]
@@ -857,8 +868,8 @@ class DataManagerV2:
             metadata_filename = BioinformaticsFileNaming.generate_metadata_filename(filename)
             metadata_path = self.data_dir / metadata_filename
             
-            with open(metadata_path, "w") as f:
-                json.dump(enhanced_metadata, f, indent=2, default=str)
+            with open(metadata_path, "wb") as f:
+                f.write(dumps_json(enhanced_metadata))
 
             # Log the processing step
             self.processing_log.append(
@@ -881,39 +892,28 @@ class DataManagerV2:
         Returns:
             Dict[str, List[Dict[str, Any]]]: Files organized by category
         """
-        files_by_category = {"data": [], "exports": [], "cache": []}
-
-        # List data files
-        for file_path in self.data_dir.iterdir():
-            if file_path.is_file():
-                files_by_category["data"].append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "modified": file_path.stat().st_mtime,
-                })
-
-        # List export files
-        for file_path in self.exports_dir.iterdir():
-            if file_path.is_file():
-                files_by_category["exports"].append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "modified": file_path.stat().st_mtime,
-                })
-
-        # List cache files
-        for file_path in self.cache_dir.iterdir():
-            if file_path.is_file():
-                files_by_category["cache"].append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size": file_path.stat().st_size,
-                    "modified": file_path.stat().st_mtime,
-                })
+        return {
+            "data": self._scan_dir(self.data_dir),
+            "exports": self._scan_dir(self.exports_dir),
+            "cache": self._scan_dir(self.cache_dir),
+        }
 
-        return files_by_category
+    @staticmethod
+    def _scan_dir(directory: Path) -> List[Dict[str, Any]]:
+        """List the regular files in a directory with one stat call per file."""
+        files = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                # is_file() is answered from the directory listing on most platforms
+                if entry.is_file():
+                    st = entry.stat()
+                    files.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": st.st_size,
+                        "modified": st.st_mtime,
+                    })
+        return files
 
     def auto_save_state(self) -> List[str]:
         """
@@ -942,9 +942,8 @@ class DataManagerV2:
                     "tool_usage_history": self.tool_usage_history,
                     "timestamp": pd.Timestamp.now().isoformat(),
                 }
-                import json
-                with open(log_path, "w") as f:
-                    json.dump(log_data, f, indent=2, default=str)
+                with open(log_path, "wb") as f:
+                    f.write(dumps_json(log_data))
                 saved_items.append("Processing log")
             except Exception as e:
                 logger.error(f"Failed to save processing log: {e}")
@@ -993,7 +992,6 @@ class DataManagerV2:
         """
         try:
             # DIAGNOSTIC: Track add_plot calls (should NOT happen during /plot command)
-            import traceback
             call_stack = ''.join(traceback.format_stack()[-3:-1])  # Get caller info
             logger.info(f"🔍 DIAGNOSTIC: add_plot() called - creating plot_{self.plot_counter + 1}")
             logger.debug(f"🔍 DIAGNOSTIC: add_plot called from:\n{call_stack.strip()}")
@@ -1006,8 +1004,9 @@ class DataManagerV2:
             plot_id = f"plot_{self.plot_counter}"
 
             # Create timestamp
-            timestamp = datetime.now().isoformat()
-            human_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            now = datetime.now()
+            timestamp = now.isoformat()
+            human_timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
 
             # Get current dataset information for context
             current_dataset_info = dataset_info or {}
@@ -1057,7 +1056,7 @@ class DataManagerV2:
                 "source": source or "unknown",
                 "dataset_info": current_dataset_info,
                 "analysis_params": analysis_params or {},
-                "created_at": datetime.now(),
+                "created_at": now,
                 "data_context": {
                     "has_modalities": self.has_data(),
                     "modality_names": list(self.modalities.keys()),
@@ -1065,12 +1064,14 @@ class DataManagerV2:
                 },
             }
 
+            # Maintain maximum size of plot history: appending to a full
+            # queue evicts the oldest plot
+            if len(self.latest_plots) == self.latest_plots.maxlen:
+                self._plot_index.pop(self.latest_plots[0]["id"], None)
+
             # Add to the queue
             self.latest_plots.append(plot_entry)
-
-            # Maintain maximum size of plot history
-            if len(self.latest_plots) > self.max_plots_history:
-                self.latest_plots.pop(0)  # Remove oldest plot
+            self._plot_index[plot_id] = plot_entry
 
             # DIAGNOSTIC: Show current state after adding plot
             plot_ids = [p.get("id", "unknown") for p in self.latest_plots]
@@ -1084,7 +1085,8 @@ class DataManagerV2:
 
     def clear_plots(self) -> None:
         """Clear all stored plots."""
-        self.latest_plots = []
+        self.latest_plots.clear()
+        self._plot_index = {}
         logger.info("All plots cleared")
 
     def get_plot_by_id(self, plot_id: str) -> Optional[go.Figure]:
@@ -1097,10 +1099,8 @@ class DataManagerV2:
         Returns:
             Optional[go.Figure]: The plot if found, None otherwise
         """
-        for plot_entry in self.latest_plots:
-            if plot_entry["id"] == plot_id:
-                return plot_entry["figure"]
-        return None
+        plot_entry = self._plot_index.get(plot_id)
+        return plot_entry["figure"] if plot_entry is not None else None
 
     def get_latest_plots(self, n: int = None) -> List[Dict[str, Any]]:
         """
@@ -1113,8 +1113,8 @@ class DataManagerV2:
             List[Dict[str, Any]]: List of plot entries with metadata
         """
         if n is None:
-            return self.latest_plots
-        return self.latest_plots[-n:]
+            return list(self.latest_plots)
+        return list(self.latest_plots)[-n:]
 
     def get_plot_history(self) -> List[Dict[str, Any]]:
         """
@@ -1136,7 +1136,6 @@ class DataManagerV2:
     def save_plots_to_workspace(self) -> List[str]:
         """Save all current plots to the workspace directory."""
         # DIAGNOSTIC: Track save_plots_to_workspace calls
-        import traceback
         call_stack = ''.join(traceback.format_stack()[-3:-1])  # Get caller info
         logger.info(f"🔍 DIAGNOSTIC: save_plots_to_workspace() called with {len(self.latest_plots)} plots")
         logger.debug(f"🔍 DIAGNOSTIC: Called from:\n{call_stack.strip()}")
@@ -1180,10 +1179,7 @@ class DataManagerV2:
                     plot_title = plot_entry["title"]
 
                     # Create sanitized filename
-                    safe_title = "".join(
-                        c for c in plot_title if c.isalnum() or c in [" ", "_", "-"]
-                    ).rstrip()
-                    safe_title = safe_title.replace(" ", "_")
+                    safe_title = sanitize_plot_title(plot_title)
                     filename_base = f"{plot_id}_{safe_title}" if safe_title else plot_id
 
                     # Save as HTML (interactive)
@@ -2211,8 +2207,8 @@ class DataManagerV2:
         }
         
         metadata_path = output_dir / f"{modality}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        with open(metadata_path, 'wb') as f:
+            f.write(dumps_json(metadata))
         export_info['files']['metadata'] = str(metadata_path)
         
         # Log export
@@ -2329,56 +2325,57 @@ class DataManagerV2:
         Returns:
             str: Formatted technical summary
         """
-        summary = "# DataManagerV2 Technical Summary\n\n"
+        parts = ["# DataManagerV2 Technical Summary\n\n"]
+        add = parts.append
 
         # Add modality information
         if self.modalities:
-            summary += "## Loaded Modalities\n\n"
+            add("## Loaded Modalities\n\n")
             for name, adata in self.modalities.items():
-                summary += f"### {name}\n"
-                summary += f"- Shape: {adata.n_obs} obs × {adata.n_vars} vars\n"
-                summary += f"- Memory usage: {adata.X.nbytes / 1024**2:.2f} MB\n" if hasattr(adata.X, 'nbytes') else ""
-                if adata.obs.columns.tolist():
-                    summary += f"- Observation metadata: {', '.join(list(adata.obs.columns)[:5])}\n"
-                if adata.var.columns.tolist():
-                    summary += f"- Variable metadata: {', '.join(list(adata.var.columns)[:5])}\n"
+                add(f"### {name}\n")
+                add(f"- Shape: {adata.n_obs} obs × {adata.n_vars} vars\n")
+                if hasattr(adata.X, 'nbytes'):
+                    add(f"- Memory usage: {adata.X.nbytes / 1024**2:.2f} MB\n")
+                if len(adata.obs.columns):
+                    add(f"- Observation metadata: {', '.join(map(str, adata.obs.columns[:5]))}\n")
+                if len(adata.var.columns):
+                    add(f"- Variable metadata: {', '.join(map(str, adata.var.columns[:5]))}\n")
                 if adata.layers:
-                    summary += f"- Data layers: {', '.join(list(adata.layers.keys()))}\n"
-                summary += "\n"
+                    add(f"- Data layers: {', '.join(adata.layers.keys())}\n")
+                add("\n")
 
         # Add processing log
         if self.processing_log:
-            summary += "## Processing Log\n\n"
-            for entry in self.processing_log:
-                summary += f"- {entry}\n"
-            summary += "\n"
+            add("## Processing Log\n\n")
+            parts.extend(f"- {entry}\n" for entry in self.processing_log)
+            add("\n")
 
         # Add tool usage history
         if self.tool_usage_history:
-            summary += "## Tool Usage History\n\n"
+            add("## Tool Usage History\n\n")
             for i, entry in enumerate(self.tool_usage_history, 1):
-                summary += f"### {i}. {entry['tool']} ({entry['timestamp']})\n\n"
+                add(f"### {i}. {entry['tool']} ({entry['timestamp']})\n\n")
                 if entry.get("description"):
-                    summary += f"{entry['description']}\n\n"
-                summary += "**Parameters:**\n\n"
+                    add(f"{entry['description']}\n\n")
+                add("**Parameters:**\n\n")
                 for param_name, param_value in entry["parameters"].items():
                     # Format parameter value based on its type
                     if isinstance(param_value, (list, tuple)) and len(param_value) > 5:
                         param_str = f"[{', '.join(str(x) for x in param_value[:5])}...] (length: {len(param_value)})"
                     else:
                         param_str = str(param_value)
-                    summary += f"- {param_name}: {param_str}\n"
-                summary += "\n"
+                    add(f"- {param_name}: {param_str}\n")
+                add("\n")
 
         # Add provenance information
         if self.provenance and self.provenance.activities:
-            summary += "## Provenance Information\n\n"
-            summary += f"- Activities: {len(self.provenance.activities)}\n"
-            summary += f"- Entities: {len(self.provenance.entities)}\n"
-            summary += f"- Agents: {len(self.provenance.agents)}\n"
-            summary += "\n"
+            add("## Provenance Information\n\n")
+            add(f"- Activities: {len(self.provenance.activities)}\n")
+            add(f"- Entities: {len(self.provenance.entities)}\n")
+            add(f"- Agents: {len(self.provenance.agents)}\n")
+            add("\n")
 
-        return summary
+        return "".join(parts)
 
     def create_data_package(
         self,
@@ -2417,35 +2414,35 @@ class DataManagerV2:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         zip_filename = Path(output_dir) / f"lobster_analysis_package_{timestamp}.zip"
 
-        # Create a temporary directory for files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
+        # Write every artifact straight into the archive; only H5AD files, which
+        # need a real path, are staged on disk one modality at a time
+        zipf = zipfile.ZipFile(zip_filename, "w")
+        try:
             if progress_callback:
                 progress_callback("Creating technical summary...")
 
             # Save technical summary
-            with open(temp_path / "technical_summary.md", "w") as f:
-                f.write(self.get_technical_summary())
+            zipf.writestr("technical_summary.md", self.get_technical_summary())
 
             # Save all modalities
             if self.modalities:
                 if progress_callback:
                     progress_callback(f"Exporting {len(self.modalities)} data modalities...")
 
-                modalities_dir = temp_path / "modalities"
-                modalities_dir.mkdir()
-
                 for i, (name, adata) in enumerate(self.modalities.items(), 1):
                     if progress_callback:
                         progress_callback(f"Saving modality {i}/{len(self.modalities)}: {name}")
                     try:
                         # Save as H5AD with configurable compression (professional standard for bioinformatics)
-                        h5ad_path = modalities_dir / f"{name}.h5ad"
-                        adata.write_h5ad(h5ad_path, compression=compression)
+                        fd, h5ad_tmp = tempfile.mkstemp(suffix=".h5ad", dir=output_dir)
+                        os.close(fd)
+                        try:
+                            adata.write_h5ad(h5ad_tmp, compression=compression)
+                            zipf.write(h5ad_tmp, f"modalities/{name}.h5ad")
+                        finally:
+                            os.unlink(h5ad_tmp)
 
                         # Save metadata (optimized to avoid unnecessary list conversions)
-                        metadata_path = modalities_dir / f"{name}_metadata.json"
                         modality_metadata = {
                             "shape": adata.shape,
                             "n_obs": adata.n_obs,
@@ -2458,8 +2455,7 @@ class DataManagerV2:
                             "is_sparse": hasattr(adata.X, 'toarray'),
                             "data_type": str(adata.X.dtype) if hasattr(adata.X, 'dtype') else 'unknown'
                         }
-                        with open(metadata_path, "w") as f:
-                            json.dump(modality_metadata, f, indent=2, default=str)
+                        zipf.writestr(f"modalities/{name}_metadata.json", dumps_json(modality_metadata))
 
                     except Exception as e:
                         logger.error(f"Failed to save modality {name}: {e}")
@@ -2471,9 +2467,6 @@ class DataManagerV2:
                 if progress_callback:
                     progress_callback(f"Exporting {len(self.latest_plots)} visualizations...")
 
-                plots_dir = temp_path / "plots"
-                plots_dir.mkdir()
-
                 # Create an index of all plots
                 plots_index = []
 
@@ -2487,32 +2480,32 @@ class DataManagerV2:
                         plot_title = plot_entry["title"]
 
                         # Create sanitized filename
-                        safe_title = "".join(
-                            c for c in plot_title if c.isalnum() or c in [" ", "_", "-"]
-                        ).rstrip()
-                        safe_title = safe_title.replace(" ", "_")
+                        safe_title = sanitize_plot_title(plot_title)
                         filename_base = f"{plot_id}_{safe_title}" if safe_title else plot_id
 
                         # Save as HTML (fast and reliable - primary format)
-                        pio.write_html(plot, plots_dir / f"{filename_base}.html")
+                        zipf.writestr(f"plots/{filename_base}.html", pio.to_html(plot))
 
                         # Save as PNG (configurable, non-blocking)
                         if include_png:
                             try:
                                 # Use kaleido engine for better reliability
                                 with SuppressKaleidoLogging():
-                                    pio.write_image(plot, plots_dir / f"{filename_base}.png", engine="kaleido", width=1200, height=800)
+                                    png = pio.to_image(plot, format="png", engine="kaleido", width=1200, height=800)
+                                zipf.writestr(f"plots/{filename_base}.png", png)
                             except Exception as e:
                                 # PNG generation failed - continue without it (don't block export)
                                 logger.debug(f"Skipped PNG for {plot_id}: {type(e).__name__}: {e}")
                                 # Note: HTML version is still available and fully interactive
 
                         # Save plot metadata
-                        with open(plots_dir / f"{filename_base}_info.txt", "w") as f:
-                            f.write(f"ID: {plot_id}\n")
-                            f.write(f"Title: {plot_title}\n")
-                            f.write(f"Created: {plot_entry.get('timestamp', 'N/A')}\n")
-                            f.write(f"Source: {plot_entry.get('source', 'N/A')}\n")
+                        zipf.writestr(
+                            f"plots/{filename_base}_info.txt",
+                            f"ID: {plot_id}\n"
+                            f"Title: {plot_title}\n"
+                            f"Created: {plot_entry.get('timestamp', 'N/A')}\n"
+                            f"Source: {plot_entry.get('source', 'N/A')}\n"
+                        )
 
                         # Add to index
                         plots_index.append({
@@ -2526,30 +2519,27 @@ class DataManagerV2:
                         logger.error(f"Failed to save plot {plot_id}: {e}")
 
                 # Save plots index
-                with open(plots_dir / "index.json", "w") as f:
-                    json.dump(plots_index, f, indent=2)
+                zipf.writestr("plots/index.json", dumps_json(plots_index, default=None))
 
                 # Create human-readable plot index
-                with open(plots_dir / "README.md", "w") as f:
-                    f.write("# Generated Plots\n\n")
-                    for idx, plot_info in enumerate(plots_index, 1):
-                        f.write(f"## {idx}. {plot_info['title']}\n\n")
-                        f.write(f"- ID: {plot_info['id']}\n")
-                        f.write(f"- Created: {plot_info['timestamp']}\n")
-                        f.write(f"- Source: {plot_info['source']}\n")
-                        f.write(f"- Files: [{plot_info['filename']}.html]({plot_info['filename']}.html), [{plot_info['filename']}.png]({plot_info['filename']}.png)\n\n")
+                readme_parts = ["# Generated Plots\n\n"]
+                for idx, plot_info in enumerate(plots_index, 1):
+                    readme_parts.append(f"## {idx}. {plot_info['title']}\n\n")
+                    readme_parts.append(f"- ID: {plot_info['id']}\n")
+                    readme_parts.append(f"- Created: {plot_info['timestamp']}\n")
+                    readme_parts.append(f"- Source: {plot_info['source']}\n")
+                    readme_parts.append(f"- Files: [{plot_info['filename']}.html]({plot_info['filename']}.html), [{plot_info['filename']}.png]({plot_info['filename']}.png)\n\n")
+                zipf.writestr("plots/README.md", "".join(readme_parts))
 
             if progress_callback:
                 progress_callback("Saving workspace metadata...")
 
             # Save workspace status
-            with open(temp_path / "workspace_status.json", "w") as f:
-                json.dump(self.get_workspace_status(), f, indent=2, default=str)
+            zipf.writestr("workspace_status.json", dumps_json(self.get_workspace_status()))
 
             # Save provenance if available and requested
             if include_provenance and self.provenance:
-                with open(temp_path / "provenance.json", "w") as f:
-                    json.dump(self.provenance.to_dict(), f, indent=2, default=str)
+                zipf.writestr("provenance.json", dumps_json(self.provenance.to_dict()))
 
             # Create professional README for the export package
             readme_content = f"""# Lobster Analysis Export Package
@@ -2594,19 +2584,16 @@ Generated with Lobster AI - Multi-Agent Bioinformatics Analysis Platform
 https://github.com/OmicsOS/lobster
 """
 
-            with open(temp_path / "README.md", "w") as f:
-                f.write(readme_content)
-
             if progress_callback:
                 progress_callback("Creating final package...")
 
-            # Create the zip file
-            with zipfile.ZipFile(zip_filename, "w") as zipf:
-                for root, _, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(temp_path)
-                        zipf.write(file_path, arcname)
+            zipf.writestr("README.md", readme_content)
+            zipf.close()
+        except BaseException:
+            # Don't leave a truncated archive behind
+            zipf.close()
+            Path(zip_filename).unlink(missing_ok=True)
+            raise
 
         logger.info(f"Data package created: {zip_filename}")
         return str(zip_filename)
@@ -2712,8 +2699,8 @@ https://github.com/OmicsOS/lobster
 
             # Write atomically
             temp_file = self.session_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(dumps_json(session_data, default=None))
             temp_file.replace(self.session_file)
 
             logger.debug(f"Updated session file: {self.session_file}")
@@ -2797,7 +2784,6 @@ https://github.com/OmicsOS/lobster
 
         else:
             # Pattern matching (glob-style)
-            import fnmatch
             for name in self.available_datasets:
                 if fnmatch.fnmatch(name, pattern):
                     size_mb = self.available_datasets[name]["size_mb"]
@@ -18,6 +18,9 @@ class BaseClient(ABC):
     implementations provide the same interface to the CLI and other components.
     """
     
+    # Lets implementations declare __slots__; those that don't keep a __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def __init__(self, *args, **kwargs):
         """Initialize the client with necessary configuration."""
@@ -994,7 +994,7 @@ Next suggested step: Import quantification data with tximport for differential e
         if count_matrix.empty:
             raise PyDESeq2Error("Count matrix is empty")
         
-        if not count_matrix.dtypes.apply(lambda x: np.issubdtype(x, np.number)).all():
+        if count_matrix.select_dtypes(include=[np.number]).shape[1] != count_matrix.shape[1]:
             raise PyDESeq2Error("Count matrix contains non-numeric data")
         
         if (count_matrix < 0).any().any():
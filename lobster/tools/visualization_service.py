@@ -837,7 +837,10 @@ class SingleCellVisualizationService:
             
             # Basic metrics
             if "n_genes" not in adata.obs.columns:
-                adata.obs["n_genes"] = (adata.X > 0).sum(axis=1)
+                if issparse(adata.X):
+                    adata.obs["n_genes"] = (adata.X > 0).sum(axis=1).A1
+                else:
+                    adata.obs["n_genes"] = (adata.X > 0).sum(axis=1)
             if "n_counts" not in adata.obs.columns:
                 if issparse(adata.X):
                     adata.obs["n_counts"] = adata.X.sum(axis=1).A1
@@ -4,18 +4,102 @@ Efficiently extract file metadata without loading full content for performance o
 """
 
 import gzip
+import os
+import threading
 import h5py
 import scanpy as sc
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
+from functools import lru_cache
 import tempfile
 from openpyxl import load_workbook
 
 from lobster.utils.logger import get_logger
 
+try:
+    import magic
+    MAGIC_AVAILABLE = True
+except ImportError:
+    MAGIC_AVAILABLE = False
+    magic = None
+
 logger = get_logger(__name__)
 
+# General file type category for each lowercase extension
+_FILE_TYPE_BY_EXTENSION = {
+    **dict.fromkeys(('.csv', '.tsv', '.txt'), 'text_data'),
+    **dict.fromkeys(('.h5ad', '.h5', '.hdf5'), 'hdf5_data'),
+    **dict.fromkeys(('.xlsx', '.xls'), 'spreadsheet'),
+    '.mtx': 'matrix',
+    **dict.fromkeys(('.png', '.jpg', '.jpeg', '.svg', '.pdf'), 'plot'),
+}
+
+
+def _suffix(name: str) -> str:
+    """Return the final suffix of a file name, with the same rules as Path.suffix."""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ''
+
+
+@lru_cache(maxsize=4096)
+def _file_type_for_name(name: str) -> str:
+    """Map a file name to its general type category, looking through .gz."""
+    extension = _suffix(name).lower()
+    
+    if extension == '.gz':
+        # Check the extension before .gz
+        stem_extension = _suffix(name[:-len(extension)]).lower()
+        extension = stem_extension if stem_extension else extension
+    
+    return _FILE_TYPE_BY_EXTENSION.get(extension, 'other')
+
+
+# Bytes read from a file when sniffing its content type
+_SNIFF_SIZE = 4096
+
+# General file type category for MIME types reported by libmagic
+_FILE_TYPE_BY_MIME = {
+    **dict.fromkeys(('text/csv', 'text/tab-separated-values'), 'text_data'),
+    'application/x-hdf5': 'hdf5_data',
+    'application/x-hdf': 'hdf5_data',
+    **dict.fromkeys((
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'application/vnd.ms-excel',
+    ), 'spreadsheet'),
+    **dict.fromkeys((
+        'image/png', 'image/jpeg', 'image/svg+xml', 'application/pdf',
+    ), 'plot'),
+}
+
+# libmagic handles must not be shared between threads, so each thread
+# opens its own on first use
+_magic_local = threading.local()
+
+
+def _get_magic():
+    """Return this thread's libmagic MIME detector, opening it on first use."""
+    detector = getattr(_magic_local, 'detector', None)
+    if detector is None:
+        detector = _magic_local.detector = magic.Magic(mime=True)
+    return detector
+
+
+def _sniff_file_type(file_path: Path) -> str:
+    """Detect the type category of a file from its content using libmagic."""
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_SNIFF_SIZE)
+        if not head:
+            return 'other'
+        
+        return _FILE_TYPE_BY_MIME.get(_get_magic().from_buffer(head), 'other')
+    except Exception as e:
+        logger.debug(f"Could not sniff file type of {file_path}: {e}")
+        return 'other'
+
 
 class FileAnalyzer:
     """
@@ -39,24 +123,29 @@ class FileAnalyzer:
     DATA_FILE_EXTENSIONS = {'.csv', '.tsv', '.txt', '.h5ad', '.h5', '.hdf5', '.xlsx', '.xls', '.mtx'}
     
     @classmethod
-    def analyze_file_metadata(cls, file_path: Union[str, Path]) -> Dict[str, Any]:
+    def analyze_file_metadata(cls, file_path: Union[str, Path],
+                              stat_info: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Extract comprehensive metadata from a file without loading full content.
         
         Args:
             file_path: Path to the file to analyze
+            stat_info: Stat result for the file if the caller already has one
             
         Returns:
             Dictionary containing file metadata
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # A single stat call serves both the existence check and the metadata
+        if stat_info is None:
+            try:
+                stat_info = file_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
             # Get basic file information
-            stat_info = file_path.stat()
             file_extension = file_path.suffix.lower()
             
             # Handle compressed files
@@ -100,9 +189,9 @@ class FileAnalyzer:
             return {
                 'name': file_path.name,
                 'path': str(file_path),
-                'size_bytes': file_path.stat().st_size if file_path.exists() else 0,
-                'created_at': datetime.fromtimestamp(file_path.stat().st_ctime) if file_path.exists() else datetime.now(),
-                'modified_at': datetime.fromtimestamp(file_path.stat().st_mtime) if file_path.exists() else datetime.now(),
+                'size_bytes': stat_info.st_size,
+                'created_at': datetime.fromtimestamp(stat_info.st_ctime),
+                'modified_at': datetime.fromtimestamp(stat_info.st_mtime),
                 'file_type': cls._get_file_type(file_path),
                 'file_format': 'unknown',
                 'is_data_file': False,
@@ -113,26 +202,13 @@ class FileAnalyzer:
     
     @classmethod
     def _get_file_type(cls, file_path: Path) -> str:
-        """Determine the general file type category."""
-        extension = file_path.suffix.lower()
-        
-        if extension == '.gz':
-            # Check the extension before .gz
-            stem_extension = Path(file_path.stem).suffix.lower()
-            extension = stem_extension if stem_extension else extension
-        
-        if extension in {'.csv', '.tsv', '.txt'}:
-            return 'text_data'
-        elif extension in {'.h5ad', '.h5', '.hdf5'}:
-            return 'hdf5_data'
-        elif extension in {'.xlsx', '.xls'}:
-            return 'spreadsheet'
-        elif extension == '.mtx':
-            return 'matrix'
-        elif extension in {'.png', '.jpg', '.jpeg', '.svg', '.pdf'}:
-            return 'plot'
-        else:
-            return 'other'
+        """Determine the general file type category, sniffing content of extensionless files."""
+        file_type = _file_type_for_name(file_path.name)
+        # An unmapped extension (.json, .log, ...) already says the file is
+        # not data; only names without one are worth reading on every listing
+        if file_type == 'other' and MAGIC_AVAILABLE and not _suffix(file_path.name):
+            file_type = _sniff_file_type(file_path)
+        return file_type
     
     @classmethod
     def _extract_data_info(cls, file_path: Path, file_format: str) -> Dict[str, Any]:
@@ -544,21 +620,45 @@ def get_workspace_files_metadata(workspace_path: Union[str, Path],
         search_path = workspace_path
     
     files_metadata = []
+    # Relative paths are built from the entry path instead of with relative_to
+    relative_base = str(Path(directory)) if directory else ''
+    prefix_len = len(str(search_path)) + len(os.sep)
     
     try:
         if search_path.exists():
-            for file_path in search_path.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        metadata = FileAnalyzer.analyze_file_metadata(file_path)
-                        # Add relative path information
-                        metadata['relative_path'] = str(file_path.relative_to(workspace_path))
-                        metadata['directory'] = str(file_path.parent.relative_to(workspace_path))
-                        files_metadata.append(metadata)
-                    except Exception as e:
-                        logger.warning(f"Could not analyze file {file_path}: {e}")
+            for entry in _iter_file_entries(str(search_path)):
+                try:
+                    metadata = FileAnalyzer.analyze_file_metadata(entry.path, stat_info=entry.stat())
+                    # Add relative path information
+                    relative_path = os.path.join(relative_base, entry.path[prefix_len:])
+                    metadata['relative_path'] = relative_path
+                    metadata['directory'] = os.path.dirname(relative_path) or '.'
+                    files_metadata.append(metadata)
+                except Exception as e:
+                    logger.warning(f"Could not analyze file {entry.path}: {e}")
         
     except Exception as e:
         logger.error(f"Error listing workspace files: {e}")
     
     return files_metadata
+
+
+def _iter_file_entries(path: str):
+    """
+    Recursively yield directory entries for all files below a directory.
+    
+    Uses os.scandir so file type checks and stat results come from the
+    directory read rather than a separate syscall per file. Directories
+    that cannot be read (e.g. permission denied) are skipped.
+    """
+    try:
+        entries = os.scandir(path)
+    except OSError as e:
+        logger.warning(f"Could not list directory {path}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_file_entries(entry.path)
+            elif entry.is_file():
+                yield entry
@@ -0,0 +1,82 @@
+"""
+JSON serialization helpers for files written by the workspace and client.
+
+orjson is used when installed and falls back to the standard library. Both
+paths go through the same conversion hook, so the output is the same JSON
+either way.
+"""
+
+import json
+import math
+from enum import Enum
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any, fallback: Optional[Callable[[Any], Any]]) -> Any:
+    """Convert a value JSON cannot represent, or raise TypeError if fallback is None."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if fallback is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return fallback(obj)
+
+
+def _to_builtin(value: Any, fallback: Optional[Callable[[Any], Any]]) -> Any:
+    """Recursively convert value to JSON builtins the way the orjson path does."""
+    if isinstance(value, float):
+        # orjson writes NaN and infinities as null
+        return value if math.isfinite(value) else None
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, dict):
+        return {key: _to_builtin(item, fallback) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item, fallback) for item in value]
+    return _to_builtin(_json_default(value, fallback), fallback)
+
+
+def dumps_json(data: Any, default: Optional[Callable[[Any], Any]] = str) -> bytes:
+    """
+    Serialize data to indented JSON bytes, using orjson when installed.
+
+    Enums are written as their value and numpy scalars and arrays as the
+    matching Python numbers and lists. Other values JSON cannot represent
+    are passed to default (str() unless given; None raises TypeError).
+    NaN and infinities are written as null, and datetimes as str() does.
+
+    Args:
+        data: Object to serialize
+        default: Converter for values JSON cannot represent, or None
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If default is None and data holds an unsupported value
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=lambda obj: _json_default(obj, default),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or non-string keys; the stdlib
+            # encoder handles them, and re-raises genuine type errors
+            pass
+    return json.dumps(
+        _to_builtin(data, default), indent=2, ensure_ascii=False, allow_nan=False
+    ).encode()
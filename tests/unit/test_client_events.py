@@ -0,0 +1,205 @@
+"""
+Tests for how AgentClient turns graph updates into stream events and a final response.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from lobster.core import client as client_module
+from lobster.core.client import AgentClient
+
+
+class StubGraph:
+    """Stands in for the agent graph, replaying fixed updates."""
+
+    def __init__(self):
+        self.updates = []
+        self.error = None
+        self.inputs = []
+        self.hang = False  # astream waits forever after its updates
+        self.cancelled = False
+
+    def stream(self, input, config, stream_mode):
+        self.inputs.append(input)
+        yield from self.updates
+        if self.error:
+            raise self.error
+
+    async def astream(self, input, config, stream_mode):
+        self.inputs.append(input)
+        try:
+            for update in self.updates:
+                yield update
+            if self.hang:
+                await asyncio.Event().wait()
+            if self.error:
+                raise self.error
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def graph():
+    return StubGraph()
+
+
+@pytest.fixture
+def client(graph, tmp_path, monkeypatch):
+    monkeypatch.setattr(client_module, "create_bioinformatics_graph", lambda **kwargs: graph)
+    return AgentClient(workspace_path=tmp_path, enable_reasoning=False)
+
+
+def test_supervisor_response_is_extracted(client):
+    event = {"supervisor": {"messages": [
+        HumanMessage(content="question"),
+        AIMessage(content="first"),
+        AIMessage(content=[{"type": "text", "text": "final answer"}]),
+    ]}}
+
+    assert client._extract_event_response(event) == "final answer"
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {"transcriptomics_expert": {"messages": [AIMessage(content="expert")]}},
+        {"supervisor": {"next": "transcriptomics_expert"}},
+        {"supervisor": {"messages": [HumanMessage(content="question")]}},
+        {"supervisor": {"messages": "not a list"}},
+        {},
+    ],
+    ids=["other-node", "no-messages", "no-ai-message", "malformed", "empty"],
+)
+def test_updates_without_supervisor_response(client, event):
+    assert client._extract_event_response(event) is None
+
+
+def test_other_nodes_are_not_logged_as_warnings(client, caplog):
+    with caplog.at_level(logging.DEBUG, logger="lobster.core.client"):
+        client._extract_event_response({"transcriptomics_expert": {"messages": []}})
+
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+
+def test_query_returns_last_supervisor_answer(client, graph):
+    graph.updates = [
+        {"supervisor": {"messages": [AIMessage(content="draft")]}},
+        {"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}},
+        {"supervisor": {"messages": [AIMessage(content="final")]}},
+    ]
+
+    result = client.query("cluster the cells")
+
+    assert result["success"]
+    assert result["response"] == "final"
+    assert result["events_count"] == 3
+    assert result["last_agent"] == "supervisor"
+    assert graph.inputs[0]["messages"][0].content == "cluster the cells"
+    assert [m.content for m in client.messages] == ["cluster the cells", "final"]
+
+
+def test_query_without_supervisor_answer(client, graph):
+    graph.updates = [{"transcriptomics_expert": {"next": "supervisor"}}]
+
+    result = client.query("hello")
+
+    assert result["response"] == "No response generated."
+
+
+def test_query_reports_graph_errors(client, graph):
+    graph.error = RuntimeError("model unavailable")
+
+    result = client.query("hello")
+
+    assert not result["success"]
+    assert result["error"] == "model unavailable"
+
+
+def test_query_stream_yields_node_output_then_complete(client, graph):
+    graph.updates = [
+        {"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}},
+        {"supervisor": {"messages": [AIMessage(content="done")]}},
+    ]
+
+    events = list(client.query("cluster the cells", stream=True))
+
+    assert [(e["type"], e.get("node"), e.get("content")) for e in events] == [
+        ("stream", "transcriptomics_expert", "clustered"),
+        ("stream", "supervisor", "done"),
+        ("complete", None, None),
+    ]
+    assert client.messages[-1].content == "done"
+
+
+def test_query_stream_returns_the_query_result(client, graph):
+    graph.updates = [{"supervisor": {"messages": [AIMessage(content="done")]}}]
+    stream = client.query_stream("hello")
+
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            next(stream)
+
+    assert stop.value.value["response"] == "done"
+
+
+def test_stream_events_carry_timestamp_and_elapsed(client, graph):
+    graph.updates = [
+        {"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}},
+        {"supervisor": {"messages": [AIMessage(content="done")]}},
+    ]
+
+    *chunks, complete = client.query("cluster the cells", stream=True)
+
+    for chunk in chunks:
+        datetime.fromisoformat(chunk["timestamp"])
+        assert chunk["elapsed"] >= 0
+    assert chunks[0]["elapsed"] <= chunks[1]["elapsed"] <= complete["duration"]
+
+
+@pytest.mark.asyncio
+async def test_astream_query_matches_query_stream(client, graph):
+    graph.updates = [
+        {"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}},
+        {"supervisor": {"messages": [AIMessage(content="done")]}},
+    ]
+
+    events = [event async for event in client.astream_query("cluster the cells")]
+
+    assert [(e["type"], e.get("node"), e.get("content")) for e in events] == [
+        ("stream", "transcriptomics_expert", "clustered"),
+        ("stream", "supervisor", "done"),
+        ("complete", None, None),
+    ]
+    assert [m.content for m in client.messages] == ["cluster the cells", "done"]
+
+
+@pytest.mark.asyncio
+async def test_astream_query_reports_graph_errors(client, graph):
+    graph.updates = [{"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}}]
+    graph.error = RuntimeError("model unavailable")
+
+    events = [event async for event in client.astream_query("hello")]
+
+    assert [e["type"] for e in events] == ["stream", "error"]
+    assert events[-1]["error"] == "model unavailable"
+
+
+@pytest.mark.asyncio
+async def test_closing_astream_query_stops_the_graph(client, graph):
+    graph.updates = [{"transcriptomics_expert": {"messages": [AIMessage(content="clustered")]}}]
+    graph.hang = True
+    stream = client.astream_query("hello")
+
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first["content"] == "clustered"
+    assert graph.cancelled
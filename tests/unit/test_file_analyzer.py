@@ -0,0 +1,106 @@
+"""
+Tests for workspace file listing and file type detection in lobster.utils.file_analyzer.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lobster.utils import file_analyzer
+from lobster.utils.file_analyzer import FileAnalyzer, get_workspace_files_metadata
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "data" / "raw").mkdir(parents=True)
+    (tmp_path / "plots").mkdir()
+    (tmp_path / "data" / "counts.csv").write_text("gene,a,b\ng1,1,2\n")
+    (tmp_path / "data" / "raw" / "notes.txt").write_text("hello\n")
+    (tmp_path / "plots" / "umap.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    return tmp_path
+
+
+def test_listing_walks_subdirectories(workspace):
+    files = get_workspace_files_metadata(workspace)
+
+    by_path = {f["relative_path"]: f for f in files}
+    assert set(by_path) == {
+        os.path.join("data", "counts.csv"),
+        os.path.join("data", "raw", "notes.txt"),
+        os.path.join("plots", "umap.png"),
+    }
+    assert by_path[os.path.join("data", "raw", "notes.txt")]["directory"] == os.path.join("data", "raw")
+    assert by_path[os.path.join("data", "counts.csv")]["size_bytes"] == len("gene,a,b\ng1,1,2\n")
+    assert by_path[os.path.join("plots", "umap.png")]["file_type"] == "plot"
+
+
+def test_listing_relative_to_subdirectory(workspace):
+    files = get_workspace_files_metadata(workspace, directory="data")
+
+    assert sorted(f["relative_path"] for f in files) == [
+        os.path.join("data", "counts.csv"),
+        os.path.join("data", "raw", "notes.txt"),
+    ]
+
+
+def test_listing_skips_unreadable_directories(workspace, monkeypatch):
+    # Whichever top-level directory is visited first is unreadable, so the
+    # test does not depend on the order scandir returns entries in
+    unreadable = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if str(path) != str(workspace) and not unreadable:
+            unreadable.append(os.path.basename(path))
+        if unreadable and os.path.basename(path) == unreadable[0]:
+            raise PermissionError(13, "Permission denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(file_analyzer.os, "scandir", scandir)
+
+    files = get_workspace_files_metadata(workspace)
+
+    expected = {
+        "data": [os.path.join("plots", "umap.png")],
+        "plots": [os.path.join("data", "counts.csv"), os.path.join("data", "raw", "notes.txt")],
+    }[unreadable[0]]
+    assert sorted(f["relative_path"] for f in files) == expected
+
+
+def test_listing_missing_directory_is_empty(tmp_path):
+    assert get_workspace_files_metadata(tmp_path, directory="missing") == []
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("counts.csv", "text_data"),
+        ("counts.tsv.gz", "text_data"),
+        ("pbmc.H5AD", "hdf5_data"),
+        ("matrix.mtx", "matrix"),
+        ("figure.svg", "plot"),
+        ("notes.json", "other"),
+    ],
+)
+def test_file_type_from_extension(name, expected):
+    assert FileAnalyzer._get_file_type(Path(name)) == expected
+
+
+def test_only_extensionless_files_are_sniffed(tmp_path, monkeypatch):
+    sniffed = []
+    monkeypatch.setattr(file_analyzer, "MAGIC_AVAILABLE", True)
+    monkeypatch.setattr(file_analyzer, "_sniff_file_type", lambda path: sniffed.append(path.name) or "hdf5_data")
+
+    assert FileAnalyzer._get_file_type(tmp_path / "notes.json") == "other"
+    assert FileAnalyzer._get_file_type(tmp_path / "counts.csv") == "text_data"
+    assert FileAnalyzer._get_file_type(tmp_path / "matrix") == "hdf5_data"
+    assert sniffed == ["matrix"]
+
+
+def test_sniffing_detects_hdf5_content(tmp_path):
+    pytest.importorskip("magic")
+    path = tmp_path / "matrix"
+    path.write_bytes(b"\x89HDF\r\n\x1a\n" + b"\0" * 512)
+
+    assert FileAnalyzer._get_file_type(path) == "hdf5_data"
@@ -0,0 +1,79 @@
+"""
+Tests for lobster.utils.json_io.dumps_json.
+
+The orjson and standard-library paths must produce the same JSON, so the
+output of a workspace file does not depend on which one is installed.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from lobster.utils import json_io
+from lobster.utils.json_io import dumps_json
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+def _dumps_stdlib(monkeypatch, data, **kwargs):
+    with monkeypatch.context() as m:
+        m.setattr(json_io, "ORJSON_AVAILABLE", False)
+        return dumps_json(data, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"count": np.int64(3), "mean": np.float64(1.5), "flag": np.bool_(True)},
+        {"values": np.array([[1, 2], [3, 4]]), "shape": (2, 2)},
+        {"created": datetime(2024, 1, 2, 3, 4, 5), "day": date(2024, 1, 2)},
+        {"missing": float("nan"), "bounds": [float("-inf"), float("inf")]},
+        {"color": _Color.RED, "name": "Zellkern é", "nested": {"none": None}},
+        {"big": 2 ** 70, 1: "int key"},
+    ],
+    ids=["numpy-scalars", "numpy-array", "datetimes", "non-finite", "enum-unicode", "stdlib-only"],
+)
+def test_orjson_and_stdlib_output_match(monkeypatch, data):
+    pytest.importorskip("orjson")
+    assert dumps_json(data) == _dumps_stdlib(monkeypatch, data)
+
+
+def test_values_are_normalized(monkeypatch):
+    data = {
+        "count": np.int64(3),
+        "created": datetime(2024, 1, 2, 3, 4, 5),
+        "missing": float("nan"),
+        "color": _Color.RED,
+        "other": {1, 2},
+    }
+
+    decoded = json.loads(_dumps_stdlib(monkeypatch, data))
+
+    assert decoded == {
+        "count": 3,
+        "created": "2024-01-02 03:04:05",
+        "missing": None,
+        "color": "red",
+        "other": "{1, 2}",
+    }
+
+
+def test_output_is_indented_utf8(monkeypatch):
+    output = _dumps_stdlib(monkeypatch, {"name": "é"})
+
+    assert output == '{\n  "name": "é"\n}'.encode("utf-8")
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_strict_mode_rejects_unsupported_values(monkeypatch, orjson_available):
+    if orjson_available:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(json_io, "ORJSON_AVAILABLE", orjson_available)
+
+    with pytest.raises(TypeError):
+        dumps_json({"value": object()}, default=None)
@@ -0,0 +1,77 @@
+"""
+Tests for the expression matrix TranscriptomicsAdapter builds from a DataFrame.
+
+Mostly-zero single-cell matrices are stored as CSR; everything else stays dense.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+pytest.importorskip("scanpy")
+
+from lobster.core.adapters.transcriptomics_adapter import TranscriptomicsAdapter
+
+
+def _counts_frame(density: float, n_obs: int = 200, n_vars: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    values = rng.integers(1, 10, size=(n_obs, n_vars)) * (rng.random((n_obs, n_vars)) < density)
+    values[:, 0] = 1  # no empty cells, so per-cell percentages are defined
+    return pd.DataFrame(
+        values,
+        index=[f"cell_{i}" for i in range(n_obs)],
+        columns=[f"gene_{j}" for j in range(n_vars)],
+    )
+
+
+def test_dense_frame_stays_dense_and_column_major():
+    df = _counts_frame(density=0.9)
+
+    adata = TranscriptomicsAdapter(data_type="bulk").from_source(df)
+
+    assert isinstance(adata.X, np.ndarray)
+    assert adata.X.dtype == np.float32
+    assert adata.X.flags.f_contiguous
+    np.testing.assert_array_equal(adata.X, df.to_numpy(dtype=np.float32))
+
+
+def test_mostly_zero_single_cell_frame_is_stored_as_csr():
+    df = _counts_frame(density=0.05)
+
+    adata = TranscriptomicsAdapter(data_type="single_cell").from_source(df)
+
+    assert isinstance(adata.X, sparse.csr_matrix)
+    np.testing.assert_array_equal(adata.X.toarray(), df.to_numpy(dtype=np.float32))
+
+
+def test_mostly_zero_bulk_frame_stays_dense():
+    df = _counts_frame(density=0.05)
+
+    adata = TranscriptomicsAdapter(data_type="bulk").from_source(df)
+
+    assert isinstance(adata.X, np.ndarray)
+
+
+def test_metadata_is_one_dimensional_for_csr():
+    df = _counts_frame(density=0.05)
+    values = df.to_numpy()
+
+    adata = TranscriptomicsAdapter(data_type="single_cell").from_source(df)
+
+    np.testing.assert_array_equal(adata.obs["n_genes"].to_numpy(), (values > 0).sum(axis=1))
+    np.testing.assert_allclose(adata.obs["total_counts"].to_numpy(), values.sum(axis=1))
+    np.testing.assert_array_equal(adata.var["n_cells"].to_numpy(), (values > 0).sum(axis=0))
+    np.testing.assert_allclose(adata.var["mean_counts"].to_numpy(), values.mean(axis=0), rtol=1e-6)
+
+
+def test_quality_metrics_density_for_csr():
+    df = _counts_frame(density=0.05)
+    adapter = TranscriptomicsAdapter(data_type="single_cell")
+
+    adata = adapter.from_source(df)
+    metrics = adapter.get_quality_metrics(adata)
+
+    expected = np.count_nonzero(df.to_numpy()) / df.size
+    assert metrics["density"] == pytest.approx(expected)
+    assert adapter.detect_data_type(adata) == "single_cell"